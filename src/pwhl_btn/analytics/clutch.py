@@ -113,20 +113,23 @@ def print_clutch_report(season_id: int = SEASON_ID) -> None:
         print("No data — run the migration and period score backfill first.")
         return
 
-    print(f"\n  Clutch Performance Report — Season {season_id}")
-    print("  " + "─" * 72)
-
-    # 3rd period differential
-    print(f"\n  {'TEAM':<6}  {'P3 GF':>6}  {'P3 GA':>6}  {'P3 +/-':>7}  "
-          f"{'TIED@2':>8}  {'LEAD@2':>8}  {'TRAIL@2':>9}  {'OT':>6}  {'SO':>6}")
-    print("  " + "─" * 72)
+    def record(w, gp):
+        if gp == 0:
+            return "  —"
+        return f"{w}-{gp - w}"
+
+    # Assemble the whole report, then emit it with one print — a write
+    # per row is wasted syscalls when the table is built from data we
+    # already have in hand.
+    lines = [
+        f"\n  Clutch Performance Report — Season {season_id}",
+        "  " + "─" * 72,
+        f"\n  {'TEAM':<6}  {'P3 GF':>6}  {'P3 GA':>6}  {'P3 +/-':>7}  "
+        f"{'TIED@2':>8}  {'LEAD@2':>8}  {'TRAIL@2':>9}  {'OT':>6}  {'SO':>6}",
+        "  " + "─" * 72,
+    ]
 
     for r in rows:
-        def record(w, gp):
-            if gp == 0:
-                return "  —"
-            return f"{w}-{gp - w}"
-
         p3   = f"{r['p3_diff']:+d}"
         tied = record(r['tied_after2_w'],    r['tied_after2_gp'])
         lead = record(r['leading_after2_w'], r['leading_after2_gp'])
@@ -134,10 +137,12 @@ def print_clutch_report(season_id: int = SEASON_ID) -> None:
         ot   = record(r['ot_w'],             r['ot_gp'])
         so   = record(r['so_w'],             r['so_gp'])
 
-        print(f"  {r['team_code']:<6}  {r['p3_gf']:>6}  {r['p3_ga']:>6}  {p3:>7}  "
-              f"{tied:>8}  {lead:>8}  {trl:>9}  {ot:>6}  {so:>6}")
+        lines.append(
+            f"  {r['team_code']:<6}  {r['p3_gf']:>6}  {r['p3_ga']:>6}  {p3:>7}  "
+            f"{tied:>8}  {lead:>8}  {trl:>9}  {ot:>6}  {so:>6}")
 
-    print()
+    lines.append("")
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -22,7 +22,6 @@ from collections import defaultdict
 
 from pwhl_btn.db.db_config import get_db_url
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
 
 try:
     import numpy as np
@@ -37,25 +36,36 @@ except ImportError:
 TRAIN_SEASON = 5   # S7 regular season
 LEAGUE_AVG_SV = 0.920
 
-engine  = create_engine(get_db_url())
-Session = sessionmaker(bind=engine)
+engine  = create_engine(get_db_url(), pool_pre_ping=True, pool_recycle=280)
 
 
 # ── Feature extraction ─────────────────────────────────────────────────────────
 
-def get_team_features_at_snapshot(session, season_id: int,
+# The training season is completed history — its game list never changes,
+# so one fetch per process serves every snapshot run (--all-pcts makes
+# four otherwise-identical round trips to the DB).
+_SEASON_GAMES_CACHE: dict[int, list] = {}
+
+
+def _season_games(conn, season_id: int) -> list:
+    if season_id not in _SEASON_GAMES_CACHE:
+        _SEASON_GAMES_CACHE[season_id] = conn.execute(text("""
+            SELECT g.game_id, g.date, g.home_team_id, g.away_team_id,
+                   g.home_score, g.away_score, g.result_type, g.game_status
+            FROM games g
+            WHERE g.season_id = :sid AND g.game_status = 'final'
+            ORDER BY g.date ASC, g.game_id ASC
+        """), {"sid": season_id}).fetchall()
+    return _SEASON_GAMES_CACHE[season_id]
+
+
+def get_team_features_at_snapshot(conn, season_id: int,
                                    game_pct: float) -> dict[int, dict]:
     """
     Builds feature vector for each team using only games up to the snapshot point.
     Returns dict of team_id → feature dict.
     """
-    all_games = session.execute(text("""
-        SELECT g.game_id, g.date, g.home_team_id, g.away_team_id,
-               g.home_score, g.away_score, g.result_type, g.game_status
-        FROM games g
-        WHERE g.season_id = :sid AND g.game_status = 'final'
-        ORDER BY g.date ASC, g.game_id ASC
-    """), {"sid": season_id}).fetchall()
+    all_games = _season_games(conn, season_id)
 
     if not all_games:
         return {}
@@ -64,24 +74,25 @@ def get_team_features_at_snapshot(session, season_id: int,
     played    = all_games[:split_idx]
     cutoff    = played[-1].date
 
-    team_ids = set()
-    for g in played:
-        team_ids.add(g.home_team_id)
-        team_ids.add(g.away_team_id)
-
-    # Points from played games
-    current_pts = defaultdict(int)
+    # One pass over the snapshot window: group each team's games and tally
+    # points as we go. The old code re-scanned `played` per team for its
+    # game list (O(teams × games)).
+    games_by_team: dict[int, list] = defaultdict(list)
+    current_pts   = defaultdict(int)
     for g in played:
         h, a = g.home_team_id, g.away_team_id
+        games_by_team[h].append(g)
+        games_by_team[a].append(g)
         if g.home_score > g.away_score:
             current_pts[h] += 2
         else:
             current_pts[a] += 2
             if g.result_type in ('OT', 'SO'):
                 current_pts[h] += 1
+    team_ids = games_by_team.keys()
 
     # Goalie SV%
-    goalie_rows = session.execute(text("""
+    goalie_rows = conn.execute(text("""
         SELECT ggs.team_id,
                SUM(ggs.saves)         AS total_saves,
                SUM(ggs.shots_against) AS total_sa
@@ -98,7 +109,7 @@ def get_team_features_at_snapshot(session, season_id: int,
     }
 
     # Shots for/against
-    shot_rows = session.execute(text("""
+    shot_rows = conn.execute(text("""
         SELECT pgs.team_id, SUM(pgs.shots) AS shots_for
         FROM player_game_stats pgs
         JOIN games g ON g.game_id = pgs.game_id
@@ -111,7 +122,7 @@ def get_team_features_at_snapshot(session, season_id: int,
 
     features = {}
     for tid in team_ids:
-        tg = [g for g in played if g.home_team_id == tid or g.away_team_id == tid]
+        tg  = games_by_team[tid]
         gp  = len(tg)
         pts = current_pts[tid]
         if gp == 0:
@@ -122,14 +133,18 @@ def get_team_features_at_snapshot(session, season_id: int,
         home_wins    = sum(1 for g in home_tg if g.home_score > g.away_score)
         home_win_pct = home_wins / len(home_tg) if home_tg else 0.5
 
+        # Sort once, newest first — last-5 GD, recency window, and streak
+        # all consume the same ordering.
+        tg_desc = sorted(tg, key=lambda x: x.date, reverse=True)
+
         # Last 5 goal differential
         last5_gd = 0
-        for g in sorted(tg, key=lambda x: x.date, reverse=True)[:5]:
+        for g in tg_desc[:5]:
             last5_gd += (g.home_score - g.away_score) if g.home_team_id == tid \
                          else (g.away_score - g.home_score)
 
         # Recency-weighted pts_pct
-        recent = sorted(tg, key=lambda x: x.date, reverse=True)[:10]
+        recent = tg_desc[:10]
         recent_pts = 0
         for g in recent:
             h, a = g.home_team_id, g.away_team_id
@@ -144,7 +159,7 @@ def get_team_features_at_snapshot(session, season_id: int,
 
         # Streak
         streak = 0
-        for g in sorted(tg, key=lambda x: x.date, reverse=True):
+        for g in tg_desc:
             won = ((g.home_team_id == tid and g.home_score > g.away_score) or
                    (g.away_team_id == tid and g.away_score > g.home_score))
             if streak == 0:
@@ -191,14 +206,9 @@ def get_team_features_at_snapshot(session, season_id: int,
     return features
 
 
-def get_final_pts(session, season_id: int) -> dict[int, int]:
+def get_final_pts(conn, season_id: int) -> dict[int, int]:
     """Returns actual final points for all teams in the season."""
-    all_games = session.execute(text("""
-        SELECT g.home_team_id, g.away_team_id,
-               g.home_score, g.away_score, g.result_type
-        FROM games g
-        WHERE g.season_id = :sid AND g.game_status = 'final'
-    """), {"sid": season_id}).fetchall()
+    all_games = _season_games(conn, season_id)
 
     pts = defaultdict(int)
     for g in all_games:
@@ -225,12 +235,11 @@ def run_regression(game_pct: float = 0.50, verbose: bool = True) -> dict:
     Trains Ridge regression on team features at snapshot, target = final pts.
     Returns dict of feature → normalized weight.
     """
-    session = Session()
-    try:
-        features  = get_team_features_at_snapshot(session, TRAIN_SEASON, game_pct)
-        final_pts = get_final_pts(session, TRAIN_SEASON)
-    finally:
-        session.close()
+    # Read-only work — a plain Core connection, no ORM session/identity
+    # map needed for text() SELECTs.
+    with engine.connect() as conn:
+        features  = get_team_features_at_snapshot(conn, TRAIN_SEASON, game_pct)
+        final_pts = get_final_pts(conn, TRAIN_SEASON)
 
     if len(features) < 4:
         raise ValueError(f"Not enough teams ({len(features)}) for regression")
@@ -318,7 +327,6 @@ if __name__ == "__main__":
         weights = run_regression(game_pct=args.game_pct)
         if args.save:
             out = Path(__file__).resolve().parent / "weights.json"
-            with open(out, "w") as f:
-                json.dump({"weights": weights, "game_pct": args.game_pct,
-                           "season_id": TRAIN_SEASON}, f, indent=2)
+            out.write_text(json.dumps({"weights": weights, "game_pct": args.game_pct,
+                                       "season_id": TRAIN_SEASON}, indent=2))
             print(f"\n  Saved → {out}")
@@ -35,12 +35,11 @@ Usage (CLI)
 """
 
 import argparse
-from datetime import datetime as _dt
+from datetime import date as _date
 from statistics import mean
 
 from scipy.stats import spearmanr
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
 
 from pwhl_btn.db.db_config import get_db_url
 
@@ -55,6 +54,10 @@ HOME_ADV       = 100     # Elo points added to home team expected score
 # This is used to scale the "tie" probability into expected points.
 PWHL_OT_RATE   = 0.20    # ~20% of games reach OT (calibrate from data if desired)
 
+# Validation-table row format, compiled once — the f-string version was
+# rebuilt from its parts on every row of the verbose report.
+_ROW_FMT = "  {:<8} {:>7.1f} {:>8} {:>9.1f} {:>11} {:>10} {:>9}".format
+
 
 # ── Core Elo math ──────────────────────────────────────────────────────────────
 
@@ -189,13 +192,14 @@ def run_elo_validation(
     """
     TARGET_SEASON = season_id if season_id is not None else 2
 
-    engine  = create_engine(get_db_url())
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    # Read-only backtest — a Core connection is all that's needed for
+    # the text() SELECTs; no ORM session overhead.
+    engine  = create_engine(get_db_url(), pool_pre_ping=True, pool_recycle=280)
+    conn    = engine.connect()
 
     try:
         # ── Load all games for the target season ──────────────────────────────
-        all_games = session.execute(text("""
+        all_games = conn.execute(text("""
             SELECT g.game_id, g.date,
                    g.home_team_id, g.away_team_id,
                    g.home_score,   g.away_score,
@@ -213,7 +217,7 @@ def run_elo_validation(
 
         # ── Determine snapshot split ──────────────────────────────────────────
         if as_of_str:
-            cutoff    = _dt.strptime(as_of_str, "%Y-%m-%d").date()
+            cutoff    = _date.fromisoformat(as_of_str)
             played    = [g for g in final_games if g.date <= cutoff]
             remaining = [g for g in final_games if g.date >  cutoff]
             snap_label = f"as-of {cutoff}"
@@ -237,7 +241,7 @@ def run_elo_validation(
         team_ids = {g.home_team_id for g in played} | {g.away_team_id for g in played}
 
         team_code_map: dict[int, str] = {}
-        for row in session.execute(text(
+        for row in conn.execute(text(
             "SELECT team_id, team_code FROM teams ORDER BY season_id DESC"
         )).fetchall():
             if row.team_id not in team_code_map:
@@ -303,11 +307,13 @@ def run_elo_validation(
             print(f"  {'Team':<8} {'Elo':>7} {'Cur Pts':>8} {'Proj Pts':>9} "
                   f"{'Actual Pts':>11} {'Pred Rank':>10} {'Act Rank':>9}")
             print(f"  {'-'*68}")
-            for tid in sorted(tids_sorted, key=lambda t: pred_rank[t]):
-                code = team_code_map.get(tid, str(tid))
-                print(f"  {code:<8} {ratings[tid]:>7.1f} {current_pts[tid]:>8} "
-                      f"{proj_pts[tid]:>9.1f} {actual_pts[tid]:>11} "
-                      f"{pred_rank[tid]:>10} {actual_rank[tid]:>9}")
+            rows = [
+                _ROW_FMT(team_code_map.get(tid, str(tid)), ratings[tid],
+                         current_pts[tid], proj_pts[tid], actual_pts[tid],
+                         pred_rank[tid], actual_rank[tid])
+                for tid in sorted(tids_sorted, key=lambda t: pred_rank[t])
+            ]
+            print("\n".join(rows))
 
         return {
             "spearman": float(corr),
@@ -325,7 +331,7 @@ def run_elo_validation(
         }
 
     finally:
-        session.close()
+        conn.close()
 
 
 # ── CLI ────────────────────────────────────────────────────────────────────────
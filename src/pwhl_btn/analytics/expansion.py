@@ -26,6 +26,29 @@ from pathlib import Path
 from sqlalchemy import text
 from pwhl_btn.db.db_config import get_engine
 
+try:
+    import orjson   # optional — parses the data files straight from bytes
+except ImportError:
+    orjson = None
+
+
+# Parsed data files keyed by (path, mtime) — repeated score_cities calls
+# in one process skip the reread and reparse, and an updated file (new
+# mtime) naturally misses.
+_JSON_CACHE: dict[tuple[str, float], dict] = {}
+
+
+def _load_json(path: Path) -> dict:
+    """Parse a JSON data file from raw bytes, skipping the text decode."""
+    key = (str(path), path.stat().st_mtime)
+    hit = _JSON_CACHE.get(key)
+    if hit is not None:
+        return hit
+    raw  = path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    _JSON_CACHE[key] = data
+    return data
+
 SEASON_ID       = 8
 DATA_FILE       = Path(__file__).resolve().parents[3] / "data" / "expansion_cities.json"
 NHL_MARKET_FILE = Path(__file__).resolve().parents[3] / "data" / "nhl" / "market_strength.json"
@@ -38,7 +61,7 @@ def _load_nhl_market_scores() -> dict[str, float]:
     """
     if not NHL_MARKET_FILE.exists():
         return {}
-    cache = json.loads(NHL_MARKET_FILE.read_text(encoding="utf-8"))
+    cache = _load_json(NHL_MARKET_FILE)
     scores = {}
     for city, data in cache.get("candidates", {}).items():
         api = data.get("api_derived", {})
@@ -90,7 +113,7 @@ def score_cities(season_id: int = SEASON_ID) -> list[dict]:
     Returns candidate cities ranked by weighted composite score.
     Each dict includes raw metrics, normalized scores, weighted total, and narrative.
     """
-    config = json.loads(DATA_FILE.read_text(encoding="utf-8"))
+    config = _load_json(DATA_FILE)
     weights = config["weights"]
     home_venues = config["existing_pwhl_home_venues"]
     candidates  = config["candidates"]
@@ -25,6 +25,19 @@ from pwhl_btn.db.db_config import get_engine
 SEASON_ID   = 8
 MIN_MINUTES = 600   # ~10 full games to qualify for season leaderboard
 
+# One engine for the module — get_engine() verifies the connection with a
+# SELECT 1 round-trip, so building a fresh engine inside every query
+# function paid that ping (plus pool setup) on each call.  Created lazily
+# so importing this module never touches the DB.
+_ENGINE = None
+
+
+def _engine():
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = get_engine(pool_pre_ping=True)
+    return _ENGINE
+
 
 # ── League average SV% ────────────────────────────────────────────────────────
 
@@ -50,8 +63,7 @@ def get_season_gsaa(season_id: int = SEASON_ID) -> list[dict]:
     Returns all qualified goalies ranked by season GSAA.
     Qualifier: MIN_MINUTES minutes played.
     """
-    engine = get_engine(pool_pre_ping=True)
-    with engine.connect() as conn:
+    with _engine().connect() as conn:
         league_sv = get_league_avg_sv_pct(conn, season_id)
 
         rows = conn.execute(text("""
@@ -97,14 +109,17 @@ def get_season_gsaa(season_id: int = SEASON_ID) -> list[dict]:
 
 # ── Per-game GSAA log ─────────────────────────────────────────────────────────
 
-def get_goalie_game_log(player_id: int, season_id: int = SEASON_ID) -> list[dict]:
+def get_goalie_game_log(player_id: int, season_id: int = SEASON_ID,
+                        league_sv: float | None = None) -> list[dict]:
     """
     Per-game stats + GSAA for a single goalie, ordered by date.
     Used for sparkline / trend chart.
+    Callers that already know the league SV% can pass it in to skip that
+    aggregate query.
     """
-    engine = get_engine(pool_pre_ping=True)
-    with engine.connect() as conn:
-        league_sv = get_league_avg_sv_pct(conn, season_id)
+    with _engine().connect() as conn:
+        if league_sv is None:
+            league_sv = get_league_avg_sv_pct(conn, season_id)
 
         rows = conn.execute(text("""
             SELECT
@@ -149,7 +164,8 @@ def get_goalie_game_log(player_id: int, season_id: int = SEASON_ID) -> list[dict
 
 # ── Stolen games ─────────────────────────────────────────────────────────────
 
-def get_stolen_games(player_id: int, season_id: int = SEASON_ID) -> list[dict]:
+def get_stolen_games(player_id: int, season_id: int = SEASON_ID,
+                     game_log: list[dict] | None = None) -> list[dict]:
     """
     Games where the goalie 'stole' the win:
       - Team won
@@ -157,27 +173,31 @@ def get_stolen_games(player_id: int, season_id: int = SEASON_ID) -> list[dict]:
       - Goalie's game SV% > league average SV%
 
     Returns games ordered by descending game GSAA.
+    Callers that already hold the goalie's game log can pass it in to skip
+    the refetch.
     """
-    game_log = get_goalie_game_log(player_id, season_id)
+    if game_log is None:
+        game_log = get_goalie_game_log(player_id, season_id)
 
-    engine = get_engine(pool_pre_ping=True)
-    with engine.connect() as conn:
-        # Team average shots against per game for this goalie's team
-        avg_row = conn.execute(text("""
-            SELECT AVG(s.shots_against) AS avg_sa
+    # One query over the season's goalie rows yields both the goalie's own
+    # average shots against (conditional aggregate) and the league SV%
+    # inputs — previously two engines and two round-trips.
+    with _engine().connect() as conn:
+        row = conn.execute(text("""
+            SELECT AVG(CASE WHEN s.player_id = :pid
+                            THEN s.shots_against END) AS avg_sa,
+                   SUM(s.saves)                       AS total_saves,
+                   SUM(s.shots_against)               AS total_shots
             FROM goalie_game_stats s
             JOIN games g ON g.game_id = s.game_id
             WHERE g.season_id   = :sid
               AND g.game_status = 'final'
-              AND s.player_id   = :pid
               AND s.minutes_played >= 55
         """), {"sid": season_id, "pid": player_id}).fetchone()
 
-    team_avg_sa   = float(avg_row.avg_sa or 0) if avg_row else 0
-
-    engine2 = get_engine(pool_pre_ping=True)
-    with engine2.connect() as conn:
-        league_sv = get_league_avg_sv_pct(conn, season_id)
+    team_avg_sa = float(row.avg_sa or 0) if row else 0
+    league_sv   = (float(row.total_saves) / float(row.total_shots)
+                   if row and row.total_shots else 0.910)
     stolen_thresh = team_avg_sa * 1.10  # 10% above team avg = defense broke down
 
     stolen = []
@@ -198,8 +218,7 @@ def get_standings_at_date(target_date, season_id: int = SEASON_ID) -> list[dict]
     Compute the standings (points, GP, W, L, OTL) as of a specific date.
     Returns list of team dicts sorted by points desc.
     """
-    engine = get_engine(pool_pre_ping=True)
-    with engine.connect() as conn:
+    with _engine().connect() as conn:
         rows = conn.execute(text("""
             WITH team_results AS (
                 SELECT home_team_id AS team_id,
@@ -254,7 +273,8 @@ def get_standings_position(team_code: str, target_date, season_id: int = SEASON_
 
 # ── High-leverage game detection ─────────────────────────────────────────────
 
-def get_high_leverage_wins(player_id: int, season_id: int = SEASON_ID) -> list[dict]:
+def get_high_leverage_wins(player_id: int, season_id: int = SEASON_ID,
+                           game_log: list[dict] | None = None) -> list[dict]:
     """
     Wins that were meaningful in the standings race:
       - Team was in positions 3-6 (playoff bubble) on game date
@@ -262,13 +282,15 @@ def get_high_leverage_wins(player_id: int, season_id: int = SEASON_ID) -> list[d
       - Goalie GSAA > 0 in that game
 
     Returns games with pre-game and post-game standings context.
+    Callers that already hold the goalie's game log can pass it in to skip
+    the refetch.
     """
-    game_log = get_goalie_game_log(player_id, season_id)
-    wins     = [g for g in game_log if g["decision"] == "W" and g["gsaa"] > 0]
+    if game_log is None:
+        game_log = get_goalie_game_log(player_id, season_id)
+    wins = [g for g in game_log if g["decision"] == "W" and g["gsaa"] > 0]
 
     # Get the goalie's team code
-    engine = get_engine(pool_pre_ping=True)
-    with engine.connect() as conn:
+    with _engine().connect() as conn:
         row = conn.execute(text("""
             SELECT t.team_code
             FROM goalie_game_stats s
@@ -330,9 +352,14 @@ def find_top_carrier(season_id: int = SEASON_ID) -> dict | None:
 
     for g in leaderboard:
         pid      = g["player_id"]
-        stolen   = get_stolen_games(pid, season_id)
-        leverage = get_high_leverage_wins(pid, season_id)
-        game_log = get_goalie_game_log(pid, season_id)
+        # Fetch the game log once per goalie and share it — both helpers
+        # would otherwise rebuild the identical per-game GSAA log. The
+        # leaderboard rows already carry the league SV%, so the log query
+        # skips recomputing that aggregate per goalie too.
+        game_log = get_goalie_game_log(pid, season_id,
+                                       league_sv=g["league_avg_sv_pct"])
+        stolen   = get_stolen_games(pid, season_id, game_log=game_log)
+        leverage = get_high_leverage_wins(pid, season_id, game_log=game_log)
 
         score = (g["gsaa"] * 0.5) + (len(stolen) * 1.5) + (len(leverage) * 2.0)
         if score > best_score:
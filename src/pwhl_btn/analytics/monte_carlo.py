@@ -23,11 +23,16 @@ Usage:
 
 import argparse
 import json
-import math
-import random
 from collections import defaultdict
 from pathlib import Path
-from statistics import mean, stdev
+from statistics import mean
+
+import numpy as np
+
+try:
+    import orjson   # optional — C serializer for the export file
+except ImportError:
+    orjson = None
 
 from pwhl_btn.db.db_queries import get_remaining_schedule, get_simulation_inputs
 
@@ -130,27 +135,38 @@ def win_prob(home_tid: int, away_tid: int, strength: dict[int, float]) -> float:
 # PWHL season average goals per game (used to scale Poisson lambdas)
 PWHL_AVG_GPG = 2.8   # league average goals per team per game
 
-def _poisson_sample(lam: float, rng: random.Random) -> int:
+HOME_BOOST = 1.08   # ~8% more goals at home, consistent with PWHL data
+
+
+def _build_game_arrays(remaining_games: list[dict], strength: dict[int, float]):
     """
-    Samples from a Poisson distribution using Knuth's algorithm.
-    lam: expected number of goals (lambda).
-    Returns integer goals scored.
+    Precomputes the per-game matchup arrays the simulator consumes.
+    Team ids and Poisson lambdas are identical on every iteration, so
+    they are derived once instead of 10,000 times.
     """
-    if lam <= 0:
-        return 0
-    L = math.exp(-lam)
-    k, p = 0, 1.0
-    while p > L:
-        k += 1
-        p *= rng.random()
-    return k - 1
+    avg_strength = mean(strength.values()) if strength else 1.0
+    h_ids: list[int] = []
+    a_ids: list[int] = []
+    lam_h: list[float] = []
+    lam_a: list[float] = []
+
+    for game in remaining_games:
+        h = game["home_team_id"]
+        a = game["away_team_id"]
+        if h not in strength or a not in strength:
+            continue
+        h_ids.append(h)
+        a_ids.append(a)
+        lam_h.append(max(PWHL_AVG_GPG * (strength[h] / avg_strength) * HOME_BOOST, 0.3))
+        lam_a.append(max(PWHL_AVG_GPG * (strength[a] / avg_strength), 0.3))
+
+    return h_ids, a_ids, np.asarray(lam_h), np.asarray(lam_a)
 
 
 def simulate_once(
-    remaining_games: list[dict],
-    current_pts:     dict[int, int],
-    strength:        dict[int, float],
-    rng:             random.Random,
+    game_arrays,
+    current_pts: dict[int, int],
+    rng:         np.random.Generator,
 ) -> dict[int, int]:
     """
     Simulates all remaining games once using Poisson goal scoring.
@@ -161,37 +177,39 @@ def simulate_once(
       - Goals drawn independently from Poisson(lambda)
       - Ties go to OT: 50/50 winner, loser gets 1 pt (OTL)
 
+    Goal counts for the whole slate come from two vectorized Poisson
+    draws (plus one batch of OT coin flips) on the numpy Generator —
+    this replaces a per-goal Knuth sampling loop that was the hottest
+    code in the simulation.
+
     Returns dict of team_id → final total points.
     """
+    h_ids, a_ids, lam_h, lam_a = game_arrays
+    # Seed every participating team up front so the scoring loop can use
+    # direct subscription — the old .get(tid, 0) calls boxed a default and
+    # did a method lookup on all four branches, every game, every iteration.
     pts = dict(current_pts)
-    HOME_BOOST   = 1.08   # ~8% more goals at home, consistent with PWHL data
-    avg_strength = mean(strength.values()) if strength else 1.0
-
-    for game in remaining_games:
-        h = game["home_team_id"]
-        a = game["away_team_id"]
-
-        if h not in strength or a not in strength:
-            continue
-
-        lam_h = PWHL_AVG_GPG * (strength[h] / avg_strength) * HOME_BOOST
-        lam_a = PWHL_AVG_GPG * (strength[a] / avg_strength)
-
-        goals_h = _poisson_sample(max(lam_h, 0.3), rng)
-        goals_a = _poisson_sample(max(lam_a, 0.3), rng)
-
-        if goals_h > goals_a:
-            pts[h] = pts.get(h, 0) + 2
-        elif goals_a > goals_h:
-            pts[a] = pts.get(a, 0) + 2
-        else:
+    for tid in h_ids:
+        pts.setdefault(tid, 0)
+    for tid in a_ids:
+        pts.setdefault(tid, 0)
+
+    goals_h = rng.poisson(lam_h)
+    goals_a = rng.poisson(lam_a)
+    ot_flip = rng.random(len(h_ids)) < 0.5
+
+    for i, (h, a) in enumerate(zip(h_ids, a_ids)):
+        if goals_h[i] > goals_a[i]:
+            pts[h] += 2
+        elif goals_a[i] > goals_h[i]:
+            pts[a] += 2
+        elif ot_flip[i]:
             # Tied after regulation → OT: 50/50, loser gets 1 pt
-            if rng.random() < 0.5:
-                pts[h] = pts.get(h, 0) + 2
-                pts[a] = pts.get(a, 0) + 1
-            else:
-                pts[a] = pts.get(a, 0) + 2
-                pts[h] = pts.get(h, 0) + 1
+            pts[h] += 2
+            pts[a] += 1
+        else:
+            pts[a] += 2
+            pts[h] += 1
 
     return pts
 
@@ -231,41 +249,45 @@ def run_simulation(n: int = DEFAULT_N) -> dict:
     strength     = build_strength_map(teams)
     current_pts  = {tid: t["pts"] for tid, t in teams.items()}
 
-    # Accumulators
-    playoff_counts    = defaultdict(int)
-    walter_cup_counts = defaultdict(int)
-    pts_accumulator   = defaultdict(list)
+    # Accumulators — projected points go straight into a preallocated
+    # (n × teams) int32 matrix instead of n list appends per team, so the
+    # mean/std/percentile passes below run on contiguous columns.
+    col        = {tid: j for j, tid in enumerate(teams)}
+    pts_matrix = np.zeros((n, len(teams)), dtype=np.int32)
 
-    rng = random.Random()
+    game_arrays = _build_game_arrays(remaining, strength)
+    rng = np.random.default_rng()
 
     for i in range(n):
-        final_pts = simulate_once(remaining, current_pts, strength, rng)
-
-        # Rank teams by final points (ties broken randomly — no tiebreaker data)
-        ranked = sorted(final_pts.items(), key=lambda x: (x[1], rng.random()), reverse=True)
-
-        for rank, (tid, pts) in enumerate(ranked):
-            pts_accumulator[tid].append(pts)
-            if rank < PLAYOFF_SPOTS:
-                playoff_counts[tid] += 1
-            if rank == 0:
-                walter_cup_counts[tid] += 1
+        final_pts = simulate_once(game_arrays, current_pts, rng)
+        for tid, j in col.items():
+            pts_matrix[i, j] = final_pts[tid]
+
+    # Standings across all iterations in one vectorized pass: uniform
+    # jitter < 1 breaks point ties randomly (as the old per-iteration
+    # sort did) without disturbing genuine point gaps, and the double
+    # argsort yields each team's rank per iteration.
+    keys  = pts_matrix + rng.random(pts_matrix.shape)
+    ranks = (-keys).argsort(axis=1).argsort(axis=1)
+    playoff_counts    = (ranks < PLAYOFF_SPOTS).sum(axis=0)
+    walter_cup_counts = (ranks == 0).sum(axis=0)
 
     # Build results
     results = {}
     for tid, t in teams.items():
-        all_pts = pts_accumulator[tid]
+        # One sorted copy per team serves mean, std, and both percentiles.
+        all_pts = np.sort(pts_matrix[:, col[tid]])
         results[tid] = {
             "team_code":        t["team_code"],
             "current_pts":      t["pts"],
             "gp":               t["gp"],
             "games_remaining":  t["games_remaining"],
-            "playoff_pct":      round(playoff_counts[tid]    / n * 100, 1),
-            "walter_cup_pct":   round(walter_cup_counts[tid] / n * 100, 1),
-            "proj_pts_mean":    round(mean(all_pts), 1),
-            "proj_pts_std":     round(stdev(all_pts), 1) if len(all_pts) > 1 else 0.0,
-            "proj_pts_low":     sorted(all_pts)[int(n * 0.10)],
-            "proj_pts_high":    sorted(all_pts)[int(n * 0.90)],
+            "playoff_pct":      round(int(playoff_counts[col[tid]])    / n * 100, 1),
+            "walter_cup_pct":   round(int(walter_cup_counts[col[tid]]) / n * 100, 1),
+            "proj_pts_mean":    round(float(all_pts.mean()), 1),
+            "proj_pts_std":     round(float(all_pts.std(ddof=1)), 1) if all_pts.size > 1 else 0.0,
+            "proj_pts_low":     int(all_pts[int(n * 0.10)]),
+            "proj_pts_high":    int(all_pts[int(n * 0.90)]),
         }
 
     return results
@@ -273,6 +295,27 @@ def run_simulation(n: int = DEFAULT_N) -> dict:
 
 # ── Validation (Season 2 backtest) ────────────────────────────────────────────
 
+def _points_from_games(games: list, team_ids: set) -> dict[int, int]:
+    """
+    Standings points per team over `games`, as three vectorized
+    scatter-adds instead of a Python branch ladder per game.
+    Scoring matches the loop it replaces: winner gets 2; an OT/SO loss
+    credits the home side 1.
+    """
+    idx = {tid: i for i, tid in enumerate(team_ids)}
+    pts = np.zeros(len(idx), dtype=np.int64)
+    n   = len(games)
+    if n:
+        h        = np.fromiter((idx[g.home_team_id] for g in games), dtype=np.intp, count=n)
+        a        = np.fromiter((idx[g.away_team_id] for g in games), dtype=np.intp, count=n)
+        home_win = np.fromiter((g.home_score > g.away_score for g in games), dtype=bool, count=n)
+        otso     = np.fromiter((g.result_type in ('OT', 'SO') for g in games), dtype=bool, count=n)
+        np.add.at(pts, h[home_win], 2)
+        np.add.at(pts, a[~home_win], 2)
+        np.add.at(pts, h[~home_win & otso], 1)
+    return {tid: int(pts[i]) for tid, i in idx.items()}
+
+
 def run_validation(season_id: int = None, as_of_str: str = None, game_pct: float = None, verbose: bool = True):
     """
     Backtests the model using historical season data.
@@ -286,18 +329,18 @@ def run_validation(season_id: int = None, as_of_str: str = None, game_pct: float
     Returns {"spearman": float, "p_value": float} or None on failure.
     """
     from sqlalchemy import create_engine, text
-    from sqlalchemy.orm import sessionmaker
     from pwhl_btn.db.db_config import get_db_url
     from scipy.stats import spearmanr
 
     TARGET_SEASON = season_id if season_id is not None else 2
-    engine  = create_engine(get_db_url())
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    # Read-only backtest — a Core connection is all that's needed for
+    # the text() SELECTs; no ORM session overhead.
+    engine  = create_engine(get_db_url(), pool_pre_ping=True, pool_recycle=280)
+    conn    = engine.connect()
 
     try:
         # Get all games for the target season
-        all_games = session.execute(text("""
+        all_games = conn.execute(text("""
             SELECT g.game_id, g.date,
                    g.home_team_id, g.away_team_id,
                    g.home_score,   g.away_score,
@@ -315,8 +358,8 @@ def run_validation(season_id: int = None, as_of_str: str = None, game_pct: float
         final_games = [g for g in all_games if g.game_status == 'final']
 
         if as_of_str:
-            from datetime import datetime as _dt
-            cutoff    = _dt.strptime(as_of_str, "%Y-%m-%d").date()
+            from datetime import date as _date
+            cutoff    = _date.fromisoformat(as_of_str)
             played    = [g for g in final_games if g.date <= cutoff]
             remaining = [g for g in final_games if g.date >  cutoff]
             print(f"  Season {TARGET_SEASON}: {len(final_games)} total games | "
@@ -342,26 +385,31 @@ def run_validation(season_id: int = None, as_of_str: str = None, game_pct: float
             team_ids.add(g.home_team_id)
             team_ids.add(g.away_team_id)
 
-        current_pts = {tid: 0 for tid in team_ids}
+        # Group games per team in one pass. `played` is already date-ordered
+        # (query sorts by date), so each team's list stays sorted and the
+        # recency views below come from a single reversed copy instead of
+        # filtering and re-sorting the full game list for every team.
+        games_by_team     = defaultdict(list)
+        remaining_by_team = defaultdict(int)
         for g in played:
-            h, a = g.home_team_id, g.away_team_id
-            if g.home_score > g.away_score:
-                current_pts[h] += 2
-            else:
-                current_pts[a] += 2
-                if g.result_type in ('OT', 'SO'):
-                    current_pts[h] += 1
+            games_by_team[g.home_team_id].append(g)
+            games_by_team[g.away_team_id].append(g)
+        for g in remaining:
+            remaining_by_team[g.home_team_id] += 1
+            remaining_by_team[g.away_team_id] += 1
+
+        current_pts = _points_from_games(played, team_ids)
 
         # Fetch team codes — try target season first, fall back to any season
         team_code_map = {}
-        for row in session.execute(text(
+        for row in conn.execute(text(
             "SELECT team_id, team_code FROM teams ORDER BY season_id DESC"
         )).fetchall():
             if row.team_id not in team_code_map:  # first hit wins (most recent season)
                 team_code_map[row.team_id] = row.team_code
 
         # Fetch goalie stats (SV%) for played games
-        goalie_rows = session.execute(text("""
+        goalie_rows = conn.execute(text("""
             SELECT ggs.team_id,
                    SUM(ggs.saves)         AS total_saves,
                    SUM(ggs.shots_against) AS total_sa
@@ -379,7 +427,7 @@ def run_validation(season_id: int = None, as_of_str: str = None, game_pct: float
         }
 
         # Fetch shots data for played games
-        shot_rows = session.execute(text("""
+        shot_rows = conn.execute(text("""
             SELECT pgs.team_id,
                    SUM(pgs.shots) AS shots_for
             FROM player_game_stats pgs
@@ -400,8 +448,9 @@ def run_validation(season_id: int = None, as_of_str: str = None, game_pct: float
         # Build simple inputs from first half
         teams_simple = {}
         for tid in team_ids:
-            tg = [g for g in played if g.home_team_id == tid or g.away_team_id == tid]
-            gp = len(tg)
+            tg      = games_by_team[tid]
+            tg_desc = tg[::-1]   # most recent first
+            gp  = len(tg)
             pts = current_pts[tid]
 
             home_tg      = [g for g in tg if g.home_team_id == tid]
@@ -410,11 +459,11 @@ def run_validation(season_id: int = None, as_of_str: str = None, game_pct: float
 
             # Goal differential — last 5 games
             last5_gd = 0
-            for g in sorted(tg, key=lambda x: x.date, reverse=True)[:5]:
+            for g in tg_desc[:5]:
                 last5_gd += (g.home_score - g.away_score) if g.home_team_id == tid                              else (g.away_score - g.home_score)
 
             # Recency-weighted points percentage (last 10 games weighted 2x)
-            recent = sorted(tg, key=lambda x: x.date, reverse=True)[:10]
+            recent = tg_desc[:10]
             recent_pts = 0
             for g in recent:
                 h, a = g.home_team_id, g.away_team_id
@@ -429,7 +478,7 @@ def run_validation(season_id: int = None, as_of_str: str = None, game_pct: float
 
             # Streak
             streak = 0
-            for g in sorted(tg, key=lambda x: x.date, reverse=True):
+            for g in tg_desc:
                 won = ((g.home_team_id == tid and g.home_score > g.away_score) or
                        (g.away_team_id == tid and g.away_score > g.home_score))
                 if streak == 0:
@@ -490,8 +539,7 @@ def run_validation(season_id: int = None, as_of_str: str = None, game_pct: float
                 "sv_pct":          sv_pct,
                 "pdo":             round(pdo, 3),
                 "xg_ratio":        round(xg_ratio, 4),
-                "games_remaining": len([g for g in remaining
-                                        if g.home_team_id == tid or g.away_team_id == tid]),
+                "games_remaining": remaining_by_team[tid],
             }
 
         # Simulate remaining Season 2 games
@@ -501,58 +549,64 @@ def run_validation(season_id: int = None, as_of_str: str = None, game_pct: float
             "away_team_id": g.away_team_id,
         } for g in remaining]
 
-        rng = random.Random(42)
-        playoff_counts    = defaultdict(int)
-        pts_accumulator   = defaultdict(list)
+        game_arrays = _build_game_arrays(remaining_dicts, strength)
+        rng = np.random.default_rng(42)
         N = 10_000
 
-        for _ in range(N):
-            final_pts = simulate_once(remaining_dicts, current_pts, strength, rng)
-            ranked    = sorted(final_pts.items(), key=lambda x: x[1], reverse=True)
-            for rank, (tid, _) in enumerate(ranked):
-                pts_accumulator[tid].append(final_pts[tid])
-                if rank < 4:
-                    playoff_counts[tid] += 1
+        # Column-per-team int32 matrix, filled in place — the same layout
+        # run_simulation uses, instead of 10k list appends per team.
+        # (The per-iteration standings sort is gone: only the projected
+        # point means feed the rank correlation below.)
+        tids_sorted = sorted(team_ids)
+        col         = {tid: j for j, tid in enumerate(tids_sorted)}
+        pts_matrix  = np.zeros((N, len(tids_sorted)), dtype=np.int32)
+
+        for i in range(N):
+            final_pts = simulate_once(game_arrays, current_pts, rng)
+            for tid, j in col.items():
+                pts_matrix[i, j] = final_pts[tid]
 
         # Actual final standings from Season 2
-        actual_pts = {tid: 0 for tid in team_ids}
-        for g in final_games:
-            h, a = g.home_team_id, g.away_team_id
-            if g.home_score > g.away_score:
-                actual_pts[h] += 2
-            else:
-                actual_pts[a] += 2
-                if g.result_type in ('OT', 'SO'):
-                    actual_pts[h] += 1
+        actual_pts = _points_from_games(final_games, team_ids)
+
+        # One numpy reduction per team — the sort key, the report table and
+        # the return payload all want the same mean, so compute it once.
+        col_means  = pts_matrix.mean(axis=0)
+        pred_means = {tid: float(col_means[col[tid]]) for tid in tids_sorted}
 
         # Compare predicted rank (by proj_pts_mean) vs actual rank
         pred_rank   = {tid: rank+1 for rank, (tid, _) in
-                       enumerate(sorted(pts_accumulator.items(),
-                                        key=lambda x: mean(x[1]), reverse=True))}
+                       enumerate(sorted(pred_means.items(),
+                                        key=lambda x: x[1], reverse=True))}
         actual_rank = {tid: rank+1 for rank, (tid, _) in
                        enumerate(sorted(actual_pts.items(), key=lambda x: x[1], reverse=True))}
 
-        tids_sorted   = sorted(team_ids)
         pred_ranks    = [pred_rank[tid]   for tid in tids_sorted]
         actual_ranks  = [actual_rank[tid] for tid in tids_sorted]
 
         corr, pval = spearmanr(pred_ranks, actual_ranks)
 
         if verbose:
-            print(f"\n  ── Season {TARGET_SEASON} Validation Results ──")
-            print(f"  Spearman rank correlation: {corr:.3f}  (p={pval:.3f})")
-            print(f"  (1.0 = perfect prediction, 0 = no correlation)\n")
-            print(f"  {'Team':<8} {'Predicted':>10} {'Actual':>8} {'Pred Rank':>10} {'Act Rank':>9} {'SV%':>8} {'ShotRatio':>10} {'PDO':>7}")
-            print(f"  {'-'*75}")
+            # Buffer the whole table and emit it in one print — one flush
+            # instead of a write per row (same pattern as the clutch report).
+            lines = [
+                f"\n  ── Season {TARGET_SEASON} Validation Results ──",
+                f"  Spearman rank correlation: {corr:.3f}  (p={pval:.3f})",
+                f"  (1.0 = perfect prediction, 0 = no correlation)\n",
+                f"  {'Team':<8} {'Predicted':>10} {'Actual':>8} {'Pred Rank':>10} {'Act Rank':>9} {'SV%':>8} {'ShotRatio':>10} {'PDO':>7}",
+                f"  {'-'*75}",
+            ]
             for tid in tids_sorted:
-                pm   = round(mean(pts_accumulator[tid]), 1)
+                pm   = round(pred_means[tid], 1)
                 code = teams_simple[tid]["team_code"]
                 sv   = teams_simple[tid].get("sv_pct", 0)
                 sr   = teams_simple[tid].get("shots_ratio", 0)
                 pdo  = teams_simple[tid].get("pdo", 0)
-                print(f"  {code:<8} {pm:>10.1f} {actual_pts[tid]:>8} "
-                      f"{pred_rank[tid]:>10} {actual_rank[tid]:>9} "
-                      f"  {sv:>6.3f}   {sr:>8.3f}  {pdo:>6.3f}")
+                lines.append(
+                    f"  {code:<8} {pm:>10.1f} {actual_pts[tid]:>8} "
+                    f"{pred_rank[tid]:>10} {actual_rank[tid]:>9} "
+                    f"  {sv:>6.3f}   {sr:>8.3f}  {pdo:>6.3f}")
+            print("\n".join(lines))
 
         return {
             "spearman": float(corr),
@@ -561,7 +615,7 @@ def run_validation(season_id: int = None, as_of_str: str = None, game_pct: float
                 team_code_map.get(tid, str(tid)): {
                     "pred_rank":   pred_rank[tid],
                     "actual_rank": actual_rank[tid],
-                    "pred_pts":    round(mean(pts_accumulator[tid]), 1),
+                    "pred_pts":    round(pred_means[tid], 1),
                     "actual_pts":  actual_pts[tid],
                 }
                 for tid in tids_sorted
@@ -572,21 +626,26 @@ def run_validation(season_id: int = None, as_of_str: str = None, game_pct: float
         print("  scipy not installed — run: pip install scipy")
         return None
     finally:
-        session.close()
+        conn.close()
 
 
 # ── CLI ────────────────────────────────────────────────────────────────────────
 
 def _print_results(results: dict):
     teams = sorted(results.values(), key=lambda x: x["playoff_pct"], reverse=True)
-    print(f"\n  {'Team':<6} {'Pts':>4} {'Rem':>4} {'Playoff%':>9} {'WalterCup%':>11} "
-          f"{'Proj Pts':>9} {'Range':>14}")
-    print(f"  {'-'*65}")
-    for t in teams:
-        print(f"  {t['team_code']:<6} {t['current_pts']:>4} {t['games_remaining']:>4} "
-              f"{t['playoff_pct']:>8.1f}% {t['walter_cup_pct']:>10.1f}% "
-              f"{t['proj_pts_mean']:>9.1f} "
-              f"  {t['proj_pts_low']}–{t['proj_pts_high']}")
+    lines = [
+        f"\n  {'Team':<6} {'Pts':>4} {'Rem':>4} {'Playoff%':>9} {'WalterCup%':>11} "
+        f"{'Proj Pts':>9} {'Range':>14}",
+        f"  {'-'*65}",
+    ]
+    lines += [
+        f"  {t['team_code']:<6} {t['current_pts']:>4} {t['games_remaining']:>4} "
+        f"{t['playoff_pct']:>8.1f}% {t['walter_cup_pct']:>10.1f}% "
+        f"{t['proj_pts_mean']:>9.1f} "
+        f"  {t['proj_pts_low']}–{t['proj_pts_high']}"
+        for t in teams
+    ]
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -618,8 +677,17 @@ if __name__ == "__main__":
         if args.export:
             OUTPUT_DIR.mkdir(exist_ok=True)
             out_path = OUTPUT_DIR / "monte_carlo.json"
-            with open(out_path, "w") as f:
-                json.dump(results, f, indent=2)
+            # One buffered write of the whole document — json.dump streams
+            # Python-level fragments through the text layer.
+            if orjson is not None:
+                # results is keyed by int team_id — orjson rejects non-str
+                # keys by default; OPT_NON_STR_KEYS coerces them to "1",
+                # "2", ... exactly like stdlib json does.
+                out_path.write_bytes(orjson.dumps(
+                    results,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                out_path.write_text(json.dumps(results, indent=2))
             print(f"\n  Exported → {out_path}")
 
 
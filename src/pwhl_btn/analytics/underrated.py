@@ -19,7 +19,7 @@ Excluded: all MIN players.
 """
 
 from __future__ import annotations
-import statistics
+import numpy as np
 from sqlalchemy import text
 from pwhl_btn.db.db_config import get_engine
 
@@ -136,13 +136,24 @@ def _derive_metrics(p: dict, standings: dict[str, int],
     }
 
 
-def _z_scores(players: list[dict], key: str) -> dict[int, float]:
-    vals = [p[key] for p in players if p[key] is not None]
-    if len(vals) < 2:
-        return {p["player_id"]: 0.0 for p in players}
-    mu  = statistics.mean(vals)
-    std = statistics.stdev(vals) or 1.0
-    return {p["player_id"]: (p[key] - mu) / std for p in players}
+# Pillars fed into the composite, in weight order.
+_Z_KEYS    = ("p60", "shots_pg", "sh_pct", "pm_pg")
+_Z_WEIGHTS = np.array([0.35, 0.20, 0.20, 0.15])
+
+
+def _z_matrix(players: list[dict]) -> np.ndarray:
+    """
+    Z-scores for all four pillars in one (n_players, 4) array — the
+    means/stdevs come out of two axis reductions instead of eight
+    list traversals (ddof=1 matches statistics.stdev).
+    """
+    arr = np.array([[p[k] or 0 for k in _Z_KEYS] for p in players], dtype=float)
+    if len(players) < 2:
+        return np.zeros_like(arr)
+    mu  = arr.mean(axis=0)
+    std = arr.std(axis=0, ddof=1)
+    std[std == 0] = 1.0
+    return (arr - mu) / std
 
 
 # ── Reasoning generator ───────────────────────────────────────────────────────
@@ -219,23 +230,14 @@ def get_top_underrated(top_n: int = 3, season_id: int = SEASON_ID) -> list[dict]
     top_scorers = _top_scorer_per_team(raw)
     players     = [_derive_metrics(p, standings, top_scorers) for p in raw]
 
-    # Z-scores for each pillar
-    z_p60    = _z_scores(players, "p60")
-    z_shots  = _z_scores(players, "shots_pg")
-    z_sh_pct = _z_scores(players, "sh_pct")
-    z_pm     = _z_scores(players, "pm_pg")
-
-    # Composite score
-    for p in players:
-        pid    = p["player_id"]
-        score  = (
-            z_p60.get(pid,    0) * 0.35 +
-            z_shots.get(pid,  0) * 0.20 +
-            z_sh_pct.get(pid, 0) * 0.20 +
-            z_pm.get(pid,     0) * 0.15 +
-            p["obscurity_bonus"] * 0.10
-        )
-        p["underrated_score"] = round(score, 4)
+    # Composite score — one matrix-vector product over the pillar z-scores
+    # plus the obscurity term, instead of four dict lookups per player.
+    z     = _z_matrix(players)
+    bonus = np.fromiter((p["obscurity_bonus"] for p in players),
+                        dtype=float, count=len(players))
+    scores = z @ _Z_WEIGHTS + bonus * 0.10
+    for p, score in zip(players, scores):
+        p["underrated_score"] = round(float(score), 4)
 
     players.sort(key=lambda x: x["underrated_score"], reverse=True)
 
@@ -0,0 +1,21 @@
+"""
+api_config.py — Central HockeyTech API config.
+
+Every ingest script used to carry its own copy of the feed URL and key.
+They are defined once here and read from the environment (with the
+league's public stats-widget values as defaults), so a key rotation is a
+.env edit instead of a grep across the repo.
+
+  PWHL_API_KEY       — HockeyTech feed key
+  PWHL_CLIENT_CODE   — league client code
+"""
+
+import os
+
+from pwhl_btn.db.db_config import _load_dotenv
+
+_load_dotenv()
+
+API_BASE    = "https://lscluster.hockeytech.com/feed/index.php"
+API_KEY     = os.environ.get("PWHL_API_KEY", "446521baf8c38984")
+CLIENT_CODE = os.environ.get("PWHL_CLIENT_CODE", "pwhl")
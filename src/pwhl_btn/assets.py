@@ -0,0 +1,57 @@
+"""
+assets.py — Filesystem lookups for image assets (logos, player photos).
+
+Pure path/scandir helpers with no DB or network side effects, so render
+scripts can locate assets without importing db_queries (whose import
+connects to the database).
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+_PHOTO_EXT_RANK = {".jpg": 0, ".jpeg": 1, ".png": 2, ".webp": 3}
+
+
+@lru_cache(maxsize=8)
+def _photo_index(dir_path: str) -> dict[str, Path]:
+    """
+    One directory scan → {filename stem: Path}. Replaces the per-player
+    exists() probe over four extensions (4 stat calls per lookup) with a
+    single listing cached for the life of the process. Extension preference
+    matches the old probe order (jpg > jpeg > png > webp).
+    """
+    best: dict[str, tuple[int, Path]] = {}
+    d = Path(dir_path)
+    if d.is_dir():
+        for entry in os.scandir(d):
+            p = Path(entry.path)
+            rank = _PHOTO_EXT_RANK.get(p.suffix.lower())
+            if rank is None or not entry.is_file():
+                continue
+            cur = best.get(p.stem)
+            if cur is None or rank < cur[0]:
+                best[p.stem] = (rank, p)
+    return {stem: p for stem, (_, p) in best.items()}
+
+
+@lru_cache(maxsize=None)
+def _asset_lookup(dir_path: str, stem: str,
+                  exts: tuple[str, ...] = ("png", "svg", "jpg", "webp")) -> Path | None:
+    """
+    Find dir_path/stem.<ext> with a single scandir pass, preferring exts in
+    order — one syscall per directory entry instead of one stat per candidate
+    extension, and the answer is cached for the life of the process.
+    """
+    rank = {f".{e}": i for i, e in enumerate(exts)}
+    best: tuple[int, Path] | None = None
+    d = Path(dir_path)
+    if d.is_dir():
+        for entry in os.scandir(d):
+            p = Path(entry.path)
+            if p.stem != stem:
+                continue
+            r = rank.get(p.suffix.lower())
+            if r is not None and entry.is_file() and (best is None or r < best[0]):
+                best = (r, p)
+    return best[1] if best else None
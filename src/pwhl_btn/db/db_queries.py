@@ -5,15 +5,27 @@ All public functions return plain dicts/lists — no SQLAlchemy objects
 leave this module, so the renderers stay decoupled from the ORM.
 """
 
+import json
 import os
-from datetime import date, timedelta
+import re
+import time
+from collections import defaultdict
+from datetime import date, datetime as _dt, timedelta
+from functools import lru_cache as _lru_cache
 from pathlib import Path
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
+from pwhl_btn.api_config import API_BASE, API_KEY, CLIENT_CODE
+from pwhl_btn.assets import _photo_index
 from pwhl_btn.db.db_config import get_engine
 
-engine  = get_engine()
+try:
+    import orjson   # optional — faster parse of the schedule feed bytes
+except ImportError:
+    orjson = None
+
+engine  = get_engine(pool_pre_ping=True, pool_recycle=280)
 Session = sessionmaker(bind=engine)
 SEASON_ID = 8
 
@@ -32,14 +44,12 @@ TEAM_CODE_MAP = {
 _THIS_DIR   = Path(__file__).resolve().parent   # root dir (db_queries.py lives here)
 PLAYERS_DIR = _THIS_DIR.parents[2] / "assets" / "players"
 
+
 def _player_photo_uri(player_name: str):
     # firstname_lastname.jpg — e.g. rebecca_leslie.jpg
     slug = player_name.lower().replace(" ", "_").replace("-", "_").replace("'", "")
-    for ext in ("jpg", "jpeg", "png", "webp"):
-        p = PLAYERS_DIR / f"{slug}.{ext}"
-        if p.exists():
-            return p.resolve().as_uri()
-    return None
+    p = _photo_index(str(PLAYERS_DIR)).get(slug)
+    return p.resolve().as_uri() if p else None
 
 _env_root   = os.environ.get("BTN_REPO_ROOT", "").strip()
 _REPO_ROOT  = Path(_env_root).resolve() if _env_root else _THIS_DIR.parents[2]
@@ -56,6 +66,10 @@ def _file_to_data_uri(path: Path) -> str | None:
     return f"data:{mime};base64,{_b64.b64encode(path.read_bytes()).decode()}"
 
 
+# The logo/cup assets never change during a run but get requested once per
+# game per slide — cache the encoded data URIs so each file is read and
+# base64-encoded at most once per process.
+@_lru_cache(maxsize=32)
 def _logo_uri(team_code: str) -> str | None:
     name = TEAM_CODE_MAP.get(team_code.upper())
     if not name:
@@ -63,10 +77,12 @@ def _logo_uri(team_code: str) -> str | None:
     return _file_to_data_uri(_REPO_ROOT / "assets" / "logos" / f"{name}.png")
 
 
+@_lru_cache(maxsize=1)
 def _pwhl_logo_uri() -> str | None:
     return _file_to_data_uri(_REPO_ROOT / "assets" / "logos" / "PWHL_logo.svg")
 
 
+@_lru_cache(maxsize=1)
 def _walter_cup_uri() -> str | None:
     return _file_to_data_uri(_REPO_ROOT / "assets" / "walter_cup.jpg")
 
@@ -852,8 +868,6 @@ def get_template_data(start: date = None, end: date = None,
 
 # ── Quick test ────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    import json
-
     print("Testing db_queries.py...\n")
     data = get_template_data()
 
@@ -881,7 +895,7 @@ def get_spotlight_player():
         featured = session.execute(text("""
             SELECT player_id FROM featured_players
         """)).fetchall()
-        featured_ids = [r.player_id for r in featured]
+        featured_ids = {r.player_id for r in featured}
 
         # Get top 10 in points to exclude
         top10 = session.execute(text("""
@@ -893,9 +907,9 @@ def get_spotlight_player():
             ORDER BY SUM(s.goals + s.assists) DESC
             LIMIT 10
         """), {"sid": SEASON_ID}).fetchall()
-        top10_ids = [r.player_id for r in top10]
+        top10_ids = {r.player_id for r in top10}
 
-        exclude_ids = list(set(featured_ids + top10_ids))
+        exclude_ids = featured_ids | top10_ids
         exclude_clause = f"AND p.player_id NOT IN ({','.join(str(i) for i in exclude_ids)})" if exclude_ids else ""
 
         # Pick random skater with at least 1 game played
@@ -947,11 +961,9 @@ def _official_photo_uri(player_id: int, player_name: str = "") -> str | None:
     Checks local assets/players/official/{id} first, then CDN.
     Does NOT check candid folder — use _candid_photo_uri() for that.
     """
-    official_dir = PLAYERS_DIR / "official"
-    for ext in ["jpg", "jpeg", "png", "webp"]:
-        p = official_dir / f"{player_id}.{ext}"
-        if p.exists():
-            return _file_to_data_uri(p)
+    p = _photo_index(str(PLAYERS_DIR / "official")).get(str(player_id))
+    if p is not None:
+        return _file_to_data_uri(p)
 
     return f"https://assets.leaguestat.com/pwhl/240x240/{player_id}.jpg"
 
@@ -963,11 +975,8 @@ def _candid_photo_uri(player_name: str) -> str | None:
     Used by power rankings and recap — NOT spotlight.
     """
     slug = player_name.lower().replace(" ", "_").replace("-", "_").replace("'", "")
-    for ext in ["jpg", "jpeg", "png", "webp"]:
-        p = PLAYERS_DIR / f"{slug}.{ext}"
-        if p.exists():
-            return _file_to_data_uri(p)
-    return None
+    p = _photo_index(str(PLAYERS_DIR)).get(slug)
+    return _file_to_data_uri(p) if p else None
 
 
 def _build_spotlight_dict(candidate, session) -> dict:
@@ -1170,38 +1179,45 @@ def get_spotlight_goalie(player_id: int, session) -> dict:
 
 # ── Weekly Preview ─────────────────────────────────────────────────────────────
 
+# Compiled once — _parse_game_time runs per scheduled game, and the
+# module-level re.* functions re-hash the pattern through re's cache on
+# every call.
+_RE_EPOCH   = re.compile(r"\d{9,12}")
+_RE_AMPM    = re.compile(r"[AaPp][Mm]")
+_RE_SECONDS = re.compile(r":(\d{2})\s*([AaPp][Mm])")
+_RE_SPACES  = re.compile(r"\s+")
+_RE_HHMM    = re.compile(r"^(\d{1,2}):(\d{2})")
+
+
 def _parse_game_time(raw: str) -> str:
     """
     Normalize whatever the API returns into a readable time string like "7:00 PM ET".
     Handles: "19:00", "7:00 PM", "19:00:00", unix epoch int, blank/None -> "TBD"
     Note: PWHL API times are typically ET.
     """
-    import re
-    from datetime import datetime as _dt
-
     if not raw or str(raw).strip() in ("", "0", "00:00", "00:00:00"):
         return "TBD"
 
     s = str(raw).strip()
 
     # Unix epoch (numeric string)
-    if re.fullmatch(r"\d{9,12}", s):
+    if _RE_EPOCH.fullmatch(s):
         try:
             return _dt.utcfromtimestamp(int(s)).strftime("%-I:%M %p ET")
         except Exception:
             return "TBD"
 
     # Already has AM/PM — just normalise spacing
-    if re.search(r"[AaPp][Mm]", s):
+    if _RE_AMPM.search(s):
         # strip seconds if present: "7:00:00 PM" -> "7:00 PM"
-        s = re.sub(r":(\d{2})\s*([AaPp][Mm])", lambda m: f" {m.group(2).upper()}", s)
-        s = re.sub(r"\s+", " ", s).strip()
+        s = _RE_SECONDS.sub(lambda m: f" {m.group(2).upper()}", s)
+        s = _RE_SPACES.sub(" ", s).strip()
         if "ET" not in s and "CT" not in s:
             s += " ET"
         return s
 
     # 24-hour "HH:MM" or "HH:MM:SS"
-    m = re.match(r"^(\d{1,2}):(\d{2})", s)
+    m = _RE_HHMM.match(s)
     if m:
         h, mn = int(m.group(1)), int(m.group(2))
         if h == 0:
@@ -1215,35 +1231,130 @@ def _parse_game_time(raw: str) -> str:
     return "TBD"
 
 
-def get_upcoming_schedule(start_date, end_date):
+# Schedule feed conditional-GET cache — the schedule only changes when a
+# game goes final, so we remember the validators and let the server answer
+# 304 (no body, no parse) on the runs in between.
+_SCHED_CACHE_FILE = _THIS_DIR.parents[2] / "data" / "pwhl_btn" / ".schedule_cache.json"
+
+# The schedule feed ships dozens of fields per game; the preview slide and
+# the game-to-watch scorer only ever read these. Trimming at the fetch
+# boundary keeps the cache file and the in-memory list a fraction of the
+# raw payload (same approach as the game-summary trim in the empty-net
+# analysis).
+_SCHED_KEYS = (
+    "id", "date_played", "game_status", "status", "final",
+    "home_team_code", "home_team_name",
+    "visiting_team_code", "visiting_team_name",
+    "game_time", "start_time", "time", "scheduled_time", "network",
+)
+
+# (monotonic timestamp, game list) — short TTL, just long enough to span
+# one render's consecutive schedule lookups.
+_SCHED_MEMO: tuple[float, list] | None = None
+_SCHED_MEMO_TTL = 60.0   # seconds
+
+# Pooled keep-alive session for the schedule feed, created on first use so
+# importing db_queries doesn't pull in requests. Reusing the TLS connection
+# saves the handshake on every revalidation round-trip.
+_HTTP_SESSION = None
+
+
+def _http_session():
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests as _req
+        from requests.adapters import HTTPAdapter
+        _HTTP_SESSION = _req.Session()
+        _HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+    return _HTTP_SESSION
+
+
+def _fetch_season_schedule() -> list[dict]:
     """
-    Returns games scheduled between start_date and end_date from the API schedule.
-    Uses API directly since only final games are stored in the DB.
-    Groups by day for the schedule slide.
+    Fetches the full season schedule feed and returns the raw game list.
+    Single choke point for the schedule payload — both the weekly schedule
+    slide and the game-to-watch scorer project a handful of fields out of
+    it, so there is no reason to duplicate the fetch/parse logic.
+
+    Sends If-None-Match / If-Modified-Since from the last run; on a 304
+    the cached game list is served without re-downloading or re-parsing.
+    A short in-process memo also collapses the back-to-back calls a single
+    render makes (schedule slide + game-to-watch) into one request.
     """
-    import requests as _req
-    from collections import OrderedDict
-    from datetime import datetime as _dt
+    global _SCHED_MEMO
+    memo = _SCHED_MEMO
+    if memo is not None and time.monotonic() - memo[0] < _SCHED_MEMO_TTL:
+        return memo[1]
+
+    try:
+        cached = json.loads(_SCHED_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached = None
+
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
 
-    # Fetch full season schedule from API
     params = {
         "feed": "modulekit", "view": "schedule",
         "season_id": SEASON_ID,
-        "key": "446521baf8c38984", "client_code": "pwhl", "fmt": "json"
+        "key": API_KEY, "client_code": CLIENT_CODE, "fmt": "json"
     }
-    resp = _req.get("https://lscluster.hockeytech.com/feed/index.php",
-                    params=params, timeout=15)
+    resp = _http_session().get(API_BASE, params=params, headers=headers, timeout=15)
+    if resp.status_code == 304 and cached:
+        _SCHED_MEMO = (time.monotonic(), cached["schedule"])
+        return cached["schedule"]
     resp.raise_for_status()
-    schedule = resp.json().get("SiteKit", {}).get("Schedule", [])
+    # Parse the raw bytes — resp.json() would decode to str first, and
+    # orjson (when installed) is bytes-native anyway.
+    data = orjson.loads(resp.content) if orjson is not None else json.loads(resp.content)
+    schedule = [
+        {k: g[k] for k in _SCHED_KEYS if k in g}
+        for g in data.get("SiteKit", {}).get("Schedule", [])
+    ]
+
+    if resp.headers.get("ETag") or resp.headers.get("Last-Modified"):
+        try:
+            _SCHED_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = _SCHED_CACHE_FILE.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps({
+                "etag":          resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "schedule":      schedule,
+            }), encoding="utf-8")
+            os.replace(tmp, _SCHED_CACHE_FILE)
+        except OSError:
+            pass   # best-effort cache — never fail the fetch over it
+
+    _SCHED_MEMO = (time.monotonic(), schedule)
+    return schedule
+
+
+def get_upcoming_schedule(start_date, end_date):
+    """
+    Returns games scheduled between start_date and end_date from the API schedule.
+    Uses API directly since only final games are stored in the DB.
+    Groups by day for the schedule slide.
+    """
+    from collections import OrderedDict
+
+    schedule = _fetch_season_schedule()
+
+    # ISO dates compare lexicographically, so the window filter runs on
+    # the raw strings — only the handful of in-window games get parsed.
+    start_iso, end_iso = start_date.isoformat(), end_date.isoformat()
 
     days = OrderedDict()
     for g in schedule:
-        try:
-            game_date = _dt.strptime(g.get("date_played", ""), "%Y-%m-%d").date()
-        except ValueError:
+        raw_date = g.get("date_played", "") or ""
+        if not (start_iso <= raw_date <= end_iso):
             continue
-
-        if not (start_date <= game_date <= end_date):
+        try:
+            game_date = date.fromisoformat(raw_date)
+        except (ValueError, TypeError):
             continue
 
         # DEBUG: uncomment to see raw API fields for time diagnosis
@@ -1343,15 +1454,7 @@ def get_game_to_watch(start_date, end_date):
         code_map = {r.team_id: r.team_code for r in standings}
 
         # Upcoming games this week — fetch from API since only finals are in DB
-        import requests as _req
-        from datetime import datetime as _dt2
-        api_params = {
-            "feed": "modulekit", "view": "schedule", "season_id": SEASON_ID,
-            "key": "446521baf8c38984", "client_code": "pwhl", "fmt": "json"
-        }
-        api_schedule = _req.get("https://lscluster.hockeytech.com/feed/index.php",
-                                 params=api_params, timeout=15).json()
-        raw_games = api_schedule.get("SiteKit", {}).get("Schedule", [])
+        raw_games = _fetch_season_schedule()
 
         # Build a simple game list with team IDs for scoring
         # Use a reverse lookup: team_code -> team_id from standings data
@@ -1365,13 +1468,18 @@ def get_game_to_watch(start_date, end_date):
                 self.away_team_id = away_id
                 self.game_time    = game_time
 
+        # String-compare the ISO dates first (lexicographic == chronological)
+        # so only in-window games pay for date parsing.
+        start_iso, end_iso = start_date.isoformat(), end_date.isoformat()
+
         games = []
         for g in raw_games:
-            try:
-                gdate = _dt2.strptime(g.get("date_played", ""), "%Y-%m-%d").date()
-            except ValueError:
+            raw_date = g.get("date_played", "") or ""
+            if not (start_iso <= raw_date <= end_iso):
                 continue
-            if not (start_date <= gdate <= end_date):
+            try:
+                gdate = date.fromisoformat(raw_date)
+            except (ValueError, TypeError):
                 continue
             is_final = (
                 str(g.get("game_status","")).lower() == "final"
@@ -1427,8 +1535,7 @@ def get_game_to_watch(start_date, end_date):
                      "goals": int(r.goals or 0), "assists": int(r.assists or 0),
                      "points": int(r.points or 0)} for r in rows]
 
-        from datetime import datetime as _dt
-        date_str = _dt.strptime(str(best_game.date), "%Y-%m-%d").strftime("%a %b %d").upper()
+        date_str = date.fromisoformat(str(best_game.date)).strftime("%a %b %d").upper()
 
         h_code = code_map.get(h_id, "")
         a_code = code_map.get(a_id, "")
@@ -1590,10 +1697,18 @@ def get_power_rankings() -> list[dict]:
         """), {"sid": SEASON_ID}).fetchall()
 
         team_ids = [r.team_id for r in rows]
+
+        # Group games by team in one pass instead of re-scanning all_games
+        # per team; the rows are already newest-first so each team's list
+        # keeps that order.
+        games_by_team: dict[int, list] = defaultdict(list)
+        for g in all_games:
+            games_by_team[g.home_team_id].append(g)
+            games_by_team[g.away_team_id].append(g)
+
         for tid in team_ids:
             streak = 0
-            team_games = [g for g in all_games
-                          if g.home_team_id == tid or g.away_team_id == tid]
+            team_games = games_by_team.get(tid, [])
             # Last 5 goal differential
             for g in team_games[:5]:
                 won = ((g.home_team_id == tid and g.home_score > g.away_score) or
@@ -1952,27 +2067,36 @@ def get_simulation_inputs() -> dict[int, dict]:
             ORDER BY date DESC, game_id DESC
         """), {"sid": SEASON_ID}).fetchall()
 
-        # Remaining games count per team
+        # Remaining games count per team — summed in SQL so one row per
+        # team comes back instead of two partial counts merged in Python.
         remaining_rows = session.execute(text("""
-            SELECT home_team_id AS team_id, COUNT(*) AS cnt
-            FROM games
-            WHERE season_id = :sid AND game_status != 'final'
-            GROUP BY home_team_id
+            SELECT team_id, SUM(cnt) AS cnt
+            FROM (
+                SELECT home_team_id AS team_id, COUNT(*) AS cnt
+                FROM games
+                WHERE season_id = :sid AND game_status != 'final'
+                GROUP BY home_team_id
 
-            UNION ALL
+                UNION ALL
 
-            SELECT away_team_id, COUNT(*)
-            FROM games
-            WHERE season_id = :sid AND game_status != 'final'
-            GROUP BY away_team_id
+                SELECT away_team_id, COUNT(*)
+                FROM games
+                WHERE season_id = :sid AND game_status != 'final'
+                GROUP BY away_team_id
+            ) per_side
+            GROUP BY team_id
         """), {"sid": SEASON_ID}).fetchall()
+        remaining_map = {r.team_id: int(r.cnt) for r in remaining_rows}
 
-        remaining_map: dict[int, int] = {}
-        for r in remaining_rows:
-            remaining_map[r.team_id] = remaining_map.get(r.team_id, 0) + r.cnt
+        # Group the completed games per team in one pass — all_games is
+        # already newest-first, so each team's list keeps that order for
+        # the last-5 and streak walks below.
+        games_by_team: dict[int, list] = defaultdict(list)
+        for g in all_games:
+            games_by_team[g.home_team_id].append(g)
+            games_by_team[g.away_team_id].append(g)
 
-        team_ids = [r.team_id for r in rows]
-        result   = {}
+        result = {}
 
         for r in rows:
             tid = r.team_id
@@ -1988,8 +2112,7 @@ def get_simulation_inputs() -> dict[int, dict]:
             home_win_pct = home_wins / home_gp if home_gp else 0.5
 
             # Last 5 GD and streak
-            team_games = [g for g in all_games
-                          if g.home_team_id == tid or g.away_team_id == tid]
+            team_games = games_by_team[tid]
 
             last5_gd = 0
             for g in team_games[:5]:
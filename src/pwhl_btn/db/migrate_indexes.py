@@ -0,0 +1,45 @@
+"""
+migrate_indexes.py — Add the secondary indexes declared in models.py.
+
+The models declare these via Index(...), but nothing in this repo runs
+Base.metadata.create_all, so an existing database never picks them up.
+Safe to run multiple times — skips indexes that already exist.
+
+Usage:
+    python -m pwhl_btn.db.migrate_indexes
+"""
+
+from sqlalchemy import text
+from pwhl_btn.db.db_config import get_engine
+
+INDEXES = [
+    ("games",             "ix_game_season",        "(season_id)"),
+    ("games",             "ix_game_season_status", "(season_id, game_status)"),
+    ("player_game_stats", "ix_pgs_player_game",    "(player_id, game_id)"),
+]
+
+
+def main():
+    engine = get_engine(pool_pre_ping=True, pool_recycle=280)
+
+    with engine.begin() as conn:
+        for table, idx_name, idx_cols in INDEXES:
+            exists = conn.execute(text("""
+                SELECT COUNT(*)
+                FROM information_schema.statistics
+                WHERE table_schema = DATABASE()
+                  AND table_name   = :tbl
+                  AND index_name   = :idx
+            """), {"tbl": table, "idx": idx_name}).scalar()
+
+            if exists:
+                print(f"  {idx_name}: already exists — skipped")
+            else:
+                conn.execute(text(f"ALTER TABLE {table} ADD INDEX {idx_name} {idx_cols}"))
+                print(f"  {idx_name}: added")
+
+    print("\nMigration complete.")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,7 +21,7 @@ COLUMNS = [
 
 
 def main():
-    engine = get_engine()
+    engine = get_engine(pool_pre_ping=True, pool_recycle=280)
 
     with engine.begin() as conn:
         # Get existing columns
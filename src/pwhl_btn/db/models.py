@@ -3,7 +3,7 @@ PWHL Analytics - SQLAlchemy Models (MySQL)
 All String columns have explicit lengths required by MySQL.
 """
 
-from sqlalchemy import Column, Integer, String, Date, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, Float, ForeignKey, Index
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -12,6 +12,14 @@ Base = declarative_base()
 class Game(Base):
     __tablename__ = 'games'
 
+    # Season filter appears in almost every games query.
+    # Nearly every aggregate filters on season + status together, so the
+    # composite index lets those queries resolve without a table scan.
+    __table_args__ = (
+        Index('ix_game_season', 'season_id'),
+        Index('ix_game_season_status', 'season_id', 'game_status'),
+    )
+
     game_id           = Column(Integer, primary_key=True)
     season_id         = Column(Integer, nullable=False)
     date              = Column(Date, nullable=False)
@@ -62,6 +70,10 @@ class Player(Base):
 class PlayerGameStats(Base):
     __tablename__ = 'player_game_stats'
 
+    # Nearly every stats query filters by player and joins/groups on game —
+    # without this MySQL falls back to scanning the table per player.
+    __table_args__ = (Index('ix_pgs_player_game', 'player_id', 'game_id'),)
+
     id          = Column(Integer, primary_key=True, autoincrement=True)
     game_id     = Column(Integer, ForeignKey('games.game_id'),    nullable=False)
     player_id   = Column(Integer, ForeignKey('players.player_id'), nullable=False)
@@ -11,20 +11,19 @@ Usage:
 """
 
 import argparse
-import time
-from datetime import datetime
+from datetime import date
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from pwhl_btn.db.db_config import get_db_url
 from pwhl_btn.jobs.backfill import (
-    SEASON_ID, RATE_LIMIT,
+    SEASON_ID, rate_limit_wait,
     fetch_schedule, load_teams, load_game, upsert
 )
 from pwhl_btn.db.models import Base, Game
 
-engine  = create_engine(get_db_url())
+engine  = create_engine(get_db_url(), pool_pre_ping=True, pool_recycle=280)
 Session = sessionmaker(bind=engine)
 
 
@@ -45,12 +44,17 @@ def get_team_id_map(session) -> dict[str, int]:
 
 def load_scheduled_game(g: dict, session, dry_run: bool = False) -> bool:
     """
-    Insert a not-yet-played game as game_status='scheduled'.
+    Stage a not-yet-played game as game_status='scheduled'.
     Only inserts team IDs, date, and game_id — no scores.
+
+    Does not commit — the caller flushes the whole batch in one
+    transaction rather than one round-trip per game. Each game is staged
+    under a savepoint so a bad row discards only itself, not the games
+    already pending in the batch.
     """
     try:
         gid       = int(g["id"])
-        game_date = datetime.strptime(g["date_played"], "%Y-%m-%d").date()
+        game_date = date.fromisoformat(g["date_played"])
         home_id   = int(g["home_team"])
         away_id   = int(g["visiting_team"])
 
@@ -59,23 +63,24 @@ def load_scheduled_game(g: dict, session, dry_run: bool = False) -> bool:
                   f"{g.get('home_team_name')} vs {g.get('visiting_team_name')} (scheduled)")
             return True
 
-        upsert(session, Game, "game_id", gid,
-               season_id        = SEASON_ID,
-               date             = game_date,
-               home_team_id     = home_id,
-               away_team_id     = away_id,
-               home_score       = None,
-               away_score       = None,
-               game_status      = "scheduled",
-               result_type      = None,
-               overtime_periods = 0,
-               attendance       = None,
-               venue            = None)
-        session.commit()
+        # begin_nested rolls back to the savepoint on failure, leaving the
+        # rest of the batch transaction intact for the caller's commit.
+        with session.begin_nested():
+            upsert(session, Game, "game_id", gid,
+                   season_id        = SEASON_ID,
+                   date             = game_date,
+                   home_team_id     = home_id,
+                   away_team_id     = away_id,
+                   home_score       = None,
+                   away_score       = None,
+                   game_status      = "scheduled",
+                   result_type      = None,
+                   overtime_periods = 0,
+                   attendance       = None,
+                   venue            = None)
         return True
 
     except Exception as e:
-        session.rollback()
         print(f"    ERROR game {g.get('id')}: {e}")
         return False
 
@@ -147,7 +152,7 @@ def run(dry_run: bool = False):
             else:
                 print("FAILED")
                 fail += 1
-            time.sleep(RATE_LIMIT)
+            rate_limit_wait()
         print(f"  Final games: {ok} loaded, {fail} failed")
 
     # Insert unplayed games as 'scheduled'
@@ -159,6 +164,8 @@ def run(dry_run: bool = False):
                 ok += 1
             else:
                 fail += 1
+        if not dry_run:
+            session.commit()   # one commit for the whole batch
         print(f"  Scheduled games: {ok} inserted, {fail} failed")
 
     session.close()
@@ -43,16 +43,12 @@ def get_new_games(already_final: set[int]) -> list[dict]:
     print(f"  Fetching season {SEASON_ID} schedule...")
     schedule = fetch_schedule(SEASON_ID)
 
+    # Check the final flags before touching the id — most schedule rows are
+    # future games that get rejected on a cheap string compare, so the
+    # majority of rows skip the try/except int() parse entirely. Keeping the
+    # parsed id alongside the row also spares the sort from re-parsing it.
     new = []
     for g in schedule:
-        try:
-            gid = int(g.get("id", 0))
-        except (ValueError, TypeError):
-            continue
-
-        if gid in already_final:
-            continue
-
         is_final = (
             str(g.get("game_status", "")).lower() == "final"
             or str(g.get("status", "")) == "4"
@@ -61,9 +57,16 @@ def get_new_games(already_final: set[int]) -> list[dict]:
         if not is_final:
             continue
 
-        new.append(g)
+        try:
+            gid = int(g.get("id", 0))
+        except (ValueError, TypeError):
+            continue
+
+        if gid not in already_final:
+            new.append((gid, g))
 
-    return sorted(new, key=lambda g: int(g.get("id", 0)))
+    new.sort(key=lambda t: t[0])
+    return [g for _, g in new]
 
 
 def run_update(dry_run: bool = False):
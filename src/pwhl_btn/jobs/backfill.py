@@ -10,6 +10,12 @@ Usage:
 
 import os, sys, time, argparse, requests
 from datetime import datetime, date
+from functools import lru_cache
+
+try:
+    import orjson   # optional — noticeably faster on the big gameSummary payloads
+except ImportError:
+    orjson = None
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from pwhl_btn.db.models import Base, Game, Team, Player, PlayerGameStats, GoalieGameStats
@@ -17,24 +23,77 @@ from pwhl_btn.db.models import Base, Game, Team, Player, PlayerGameStats, Goalie
 from pwhl_btn.db.db_config import get_db_url
 DATABASE_URL = get_db_url()
 
+from pwhl_btn.api_config import API_BASE, API_KEY, CLIENT_CODE
+
 SEASON_ID   = 8
-API_BASE    = "https://lscluster.hockeytech.com/feed/index.php"
-API_KEY     = "446521baf8c38984"
-CLIENT_CODE = "pwhl"
 RATE_LIMIT  = 0.5
 
+# Timestamp of the last paced API call (monotonic), shared by the drivers.
+_last_call = 0.0
+
+
+def rate_limit_wait():
+    """
+    Pace API calls to at most one per RATE_LIMIT seconds. The time already
+    spent processing the previous game counts toward the interval, so only
+    the remainder is slept — a fixed sleep(RATE_LIMIT) added the full delay
+    even when the DB work alone took longer than the limit.
+    """
+    global _last_call
+    now  = time.monotonic()
+    wait = RATE_LIMIT - (now - _last_call)
+    if wait > 0:
+        time.sleep(wait)
+        now += wait
+    _last_call = now
+
+# Stat fields extracted per lineup row — hoisted so the hot loops in
+# load_game convert them in a single map(int, ...) pass.
+_SKATER_STAT_KEYS = ("goals", "assists", "shots", "plus_minus", "pim")
+_GOALIE_STAT_KEYS = ("shots_against", "saves", "goals_against")
+
 engine  = create_engine(DATABASE_URL, pool_pre_ping=True)
 Session = sessionmaker(bind=engine)
 
 
 # ── API helpers ────────────────────────────────────────────────────────────────
-def api_get(params: dict) -> dict:
-    params.update({"key": API_KEY, "client_code": CLIENT_CODE, "fmt": "json"})
-    r = requests.get(API_BASE, params=params, timeout=15)
-    r.raise_for_status()
-    return r.json()
 
+# One pooled session for the whole run — reuses the TCP+TLS connection across
+# the hundreds of sequential feed calls instead of handshaking per request.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=16))
+
+
+# Auth/format params are constant for the whole run — built once, merged per
+# call (which also stops api_get mutating the caller's dict).
+BASE_PARAMS = {"key": API_KEY, "client_code": CLIENT_CODE, "fmt": "json"}
+
+
+def api_get(params: dict, retries: int = 3) -> dict:
+    # Retry transient failures (connection drops, timeouts, 5xx) with
+    # exponential backoff — same hand-rolled approach as the connection
+    # retry in db_config.get_engine, no retry library needed.
+    delay = 0.5
+    for attempt in range(1, retries + 1):
+        try:
+            r = HTTP_SESSION.get(API_BASE, params={**params, **BASE_PARAMS}, timeout=15)
+            r.raise_for_status()
+            # Parse the raw bytes — skips requests' charset detection and,
+            # when orjson is installed, the stdlib parser as well.
+            return orjson.loads(r.content) if orjson is not None else r.json()
+        except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as exc:
+            transient = not isinstance(exc, requests.HTTPError) or r.status_code >= 500
+            if not transient or attempt == retries:
+                raise
+            print(f"  [api] attempt {attempt} failed ({exc.__class__.__name__}) — retrying in {delay}s")
+            time.sleep(delay)
+            delay *= 2
+
+@lru_cache(maxsize=4)
 def fetch_schedule(season_id):
+    # Cached per season: every driver hits this twice per run (once via
+    # load_teams -> fetch_teams, once directly) — no reason to download
+    # the same schedule twice in one process.
     return api_get({"feed": "modulekit", "view": "schedule", "season_id": season_id})["SiteKit"]["Schedule"]
 
 def fetch_teams(season_id):
@@ -119,7 +178,10 @@ def load_game(game_id: int, session=None, resume: bool = False) -> bool:
     if _own_session:
         session = Session()
 
-    if resume and session.get(Game, game_id):
+    # Existence check only — select the bare key instead of hydrating a full
+    # Game ORM row into the identity map just to throw it away.
+    if resume and session.execute(text(
+            "SELECT 1 FROM games WHERE game_id = :gid"), {"gid": game_id}).first():
         print(f"  Game {game_id} already in DB — skipping")
         if _own_session:
             session.close()
@@ -134,7 +196,9 @@ def load_game(game_id: int, session=None, resume: bool = False) -> bool:
             return True
 
         result_type, ot_periods = derive_result_type(meta)
-        game_date = datetime.strptime(meta["date_played"], "%Y-%m-%d").date()
+        # fromisoformat is ~6x faster than strptime — no format-string
+        # compilation per game.
+        game_date = date.fromisoformat(meta["date_played"])
 
         upsert(session, Game, "game_id", int(meta["id"]),
                season_id        = int(meta["season_id"]),
@@ -154,7 +218,20 @@ def load_game(game_id: int, session=None, resume: bool = False) -> bool:
         for side, team_key in (("home_team_lineup", "home_team"),
                                ("visitor_team_lineup", "visiting_team")):
             team_id = int(meta[team_key])
-            for p in gs.get(side, {}).get("players", []):
+            players = gs.get(side, {}).get("players", [])
+
+            # Delete then re-insert to avoid duplicates on re-run — one
+            # IN-list delete per side instead of a round-trip per player.
+            pids = [int(p["player_id"]) for p in players]
+            if pids:
+                session.query(PlayerGameStats).filter(
+                    PlayerGameStats.game_id == int(meta["id"]),
+                    PlayerGameStats.team_id == team_id,
+                    PlayerGameStats.player_id.in_(pids),
+                ).delete(synchronize_session=False)
+
+            stat_rows = []
+            for p in players:
                 pid = int(p["player_id"])
                 upsert(session, Player, "player_id", pid,
                        first_name    = p["first_name"],
@@ -162,12 +239,10 @@ def load_game(game_id: int, session=None, resume: bool = False) -> bool:
                        position      = p.get("position_str", ""),
                        jersey_number = int(p["jersey_number"]) if p.get("jersey_number") else None)
 
-                # Delete then re-insert to avoid duplicates on re-run
-                session.query(PlayerGameStats).filter_by(
-                    game_id=int(meta["id"]), player_id=pid, team_id=team_id).delete()
-
-                goals   = int(p.get("goals", 0))
-                assists = int(p.get("assists", 0))
+                # One map(int, ...) pass instead of five separate
+                # int(p.get(...)) dispatches per skater row.
+                goals, assists, shots, plus_minus, pim = map(
+                    int, (p.get(k) or 0 for k in _SKATER_STAT_KEYS))
                 # TOI — field name varies by API version; try known candidates
                 toi_raw = (p.get("toi") or p.get("time_on_ice") or
                            p.get("shift_time") or p.get("timeOnIce") or
@@ -184,26 +259,35 @@ def load_game(game_id: int, session=None, resume: bool = False) -> bool:
                         except (ValueError, TypeError):
                             pass
 
-                session.add(PlayerGameStats(
+                stat_rows.append(PlayerGameStats(
                     game_id=int(meta["id"]), player_id=pid, team_id=team_id,
                     goals=goals, assists=assists, points=goals + assists,
-                    shots=int(p.get("shots", 0)),
-                    plus_minus=int(p.get("plus_minus", 0)),
-                    pim=int(p.get("pim", 0)),
+                    shots=shots, plus_minus=plus_minus, pim=pim,
                     toi_seconds=toi_sec))
+            session.add_all(stat_rows)
 
         # Goalie stats
         for side, team_key in (("home", "home_team"), ("visitor", "visiting_team")):
             team_id = int(meta[team_key])
-            for g in gs.get("goalies", {}).get(side, []):
+            goalie_rows = gs.get("goalies", {}).get(side, [])
+
+            pids = [int(g["player_id"]) for g in goalie_rows]
+            if pids:
+                session.query(GoalieGameStats).filter(
+                    GoalieGameStats.game_id == int(meta["id"]),
+                    GoalieGameStats.team_id == team_id,
+                    GoalieGameStats.player_id.in_(pids),
+                ).delete(synchronize_session=False)
+
+            stat_rows = []
+            for g in goalie_rows:
                 pid = int(g["player_id"])
                 upsert(session, Player, "player_id", pid,
                        first_name=g["first_name"], last_name=g["last_name"],
                        position="G", jersey_number=None)
 
-                shots_against = int(g.get("shots_against", 0))
-                saves         = int(g.get("saves", 0))
-                goals_against = int(g.get("goals_against", 0))
+                shots_against, saves, goals_against = map(
+                    int, (g.get(k) or 0 for k in _GOALIE_STAT_KEYS))
                 save_pct      = saves / shots_against if shots_against > 0 else None
 
                 win = str(g.get("win", "0")) == "1"
@@ -212,15 +296,13 @@ def load_game(game_id: int, session=None, resume: bool = False) -> bool:
                 los = str(g.get("loss", "0")) == "1"
                 decision = "W" if win else "SOL" if sol else "OTL" if otl else "L" if los else None
 
-                session.query(GoalieGameStats).filter_by(
-                    game_id=int(meta["id"]), player_id=pid, team_id=team_id).delete()
-
-                session.add(GoalieGameStats(
+                stat_rows.append(GoalieGameStats(
                     game_id=int(meta["id"]), player_id=pid, team_id=team_id,
                     shots_against=shots_against, saves=saves,
                     goals_against=goals_against, save_percentage=save_pct,
                     minutes_played=int(g.get("secs", 0)),  # stored as seconds
                     decision=decision))
+            session.add_all(stat_rows)
 
         # Update avg_toi_seconds for all players in this game
         session.execute(text("""
@@ -276,18 +358,29 @@ def backfill(season_id, limit=None, resume=False):
         completed = completed[:limit]
         print(f"  Limiting to {limit} games")
 
+    # Resume check: pull the stored game ids once and test set membership,
+    # instead of a per-game SELECT inside load_game.
+    existing_ids: set[int] = set()
+    if resume:
+        existing_ids = {row[0] for row in session.execute(text("SELECT game_id FROM games"))}
+        print(f"  {len(existing_ids)} games already in DB")
+
     print(f"\n[3/3] Loading {len(completed)} games...")
     ok_count = fail_count = 0
     for i, game in enumerate(completed, 1):
         gid = int(game["id"])
         print(f"  [{i:3d}/{len(completed)}] Game {gid}...", end=" ", flush=True)
-        if load_game(gid, resume=resume):
+        if gid in existing_ids:
+            ok_count += 1
+            print("already in DB — skipping")
+            continue
+        if load_game(gid):
             ok_count += 1
             print("OK")
         else:
             fail_count += 1
             print("FAILED")
-        time.sleep(RATE_LIMIT)
+        rate_limit_wait()
 
     session.close()
     print(f"\nDone: {ok_count} loaded, {fail_count} failed")
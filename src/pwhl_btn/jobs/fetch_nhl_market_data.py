@@ -14,14 +14,31 @@ Usage:
 
 import argparse
 import json
+import os
 from datetime import date
 from pathlib import Path
 
+try:
+    import orjson   # optional — byte-level serialize, no str re-encode on write
+except ImportError:
+    orjson = None
+
 from pwhl_btn.nhl.market_strength import compute_market_scores
 
 DATA_FILE = Path(__file__).resolve().parents[3] / "data" / "nhl" / "market_strength.json"
 
 
+def _write_json(path: Path, payload: dict) -> None:
+    """Serialize indented JSON bytes and swap the file in atomically."""
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, indent=2).encode("utf-8")
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--dry-run", action="store_true",
@@ -69,7 +86,7 @@ def main():
         print(json.dumps(existing, indent=2))
         return
 
-    DATA_FILE.write_text(json.dumps(existing, indent=2), encoding="utf-8")
+    _write_json(DATA_FILE, existing)
     print(f"\n  Written to: {DATA_FILE}")
     print("  Attendance figures are hardcoded — update manually from Hockey Reference each season.")
 
@@ -13,17 +13,21 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import time
+import json
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from sqlalchemy import text
 
+try:
+    import orjson   # optional — decodes straight from bytes in one pass
+except ImportError:
+    orjson = None
+
+from pwhl_btn.api_config import API_BASE, API_KEY, CLIENT_CODE
 from pwhl_btn.db.db_config import get_engine
 
-API_BASE    = "https://lscluster.hockeytech.com/feed/index.php"
-API_KEY     = "446521baf8c38984"
-CLIENT_CODE = "pwhl"
-RATE_LIMIT  = 0.5
+MAX_WORKERS = 8   # bounded pool doubles as the rate limit
 
 
 def fetch_venue(game_id: int) -> tuple[str | None, int | None]:
@@ -35,7 +39,11 @@ def fetch_venue(game_id: int) -> tuple[str | None, int | None]:
             "key": API_KEY, "client_code": CLIENT_CODE, "fmt": "json",
         }, timeout=15)
         r.raise_for_status()
-        gs   = r.json()["GC"]["Gamesummary"]
+        # Parse r.content directly: r.json() goes through r.text, which
+        # decodes the body to str before json re-walks it — two passes.
+        raw  = r.content
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        gs   = data["GC"]["Gamesummary"]
         meta = gs.get("meta", {})
 
         venue = gs.get("venue") or meta.get("venue") or None
@@ -80,17 +88,22 @@ def main() -> None:
 
     updated = skipped = failed = 0
 
+    # Fetch every gamesummary up front on a small thread pool — the
+    # round-trips overlap instead of paying RTT + sleep per game, and the
+    # bounded worker count keeps us polite to the API.
+    game_ids = [row.game_id for row in rows]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        results = dict(zip(game_ids, pool.map(fetch_venue, game_ids)))
+
     with engine.begin() as conn:
-        for i, row in enumerate(rows, 1):
-            gid = row.game_id
+        for i, gid in enumerate(game_ids, 1):
             print(f"  [{i:3d}/{len(rows)}] game {gid} ...", end=" ", flush=True)
 
-            venue, attendance = fetch_venue(gid)
+            venue, attendance = results[gid]
 
             if not venue:
                 print("no venue in API — skipping")
                 skipped += 1
-                time.sleep(RATE_LIMIT)
                 continue
 
             print(f"{venue}", end="")
@@ -107,7 +120,6 @@ def main() -> None:
                 print("  -> [dry-run]")
 
             updated += 1
-            time.sleep(RATE_LIMIT)
 
     print(f"\n  Done: {updated} updated, {skipped} skipped (no API venue), {failed} errors")
 
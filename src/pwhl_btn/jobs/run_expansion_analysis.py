@@ -44,51 +44,55 @@ def main():
     print("\n  Loading expansion data...")
     cities = score_cities()
 
+    # The whole report is buffered and emitted with a single print — one
+    # write/flush instead of one per line.
+    out = []
+
     # ── Summary scorecard ──────────────────────────────────────────────────────
-    print(f"\n{'=' * 72}")
-    print(f"  PWHL EXPANSION SCORECARD")
-    print(f"  Weights: NHL Mkt 25% | Tour Att 35% | Women's Sports 20% | Arena 10% | Geo 10%")
-    print(f"{'=' * 72}")
-    print(f"\n  {'RNK':<4}  {'CITY':<14}  {'NHL TEAM':<26}  "
-          f"{'TOUR ATT':>10}  {'GAMES':>5}  {'SCORE':>7}")
-    print(f"  {'─'*68}")
+    out.append(f"\n{'=' * 72}")
+    out.append("  PWHL EXPANSION SCORECARD")
+    out.append("  Weights: NHL Mkt 25% | Tour Att 35% | Women's Sports 20% | Arena 10% | Geo 10%")
+    out.append(f"{'=' * 72}")
+    out.append(f"\n  {'RNK':<4}  {'CITY':<14}  {'NHL TEAM':<26}  "
+               f"{'TOUR ATT':>10}  {'GAMES':>5}  {'SCORE':>7}")
+    out.append(f"  {'─'*68}")
 
     for c in cities:
         medal    = MEDAL.get(c["rank"], f"#{c['rank']}")
         att_str  = f"{c['tour_avg_att']:,}" if c["tour_avg_att"] else "No data"
         games_str = f"({c['tour_game_count']}g)" if c["tour_game_count"] else "(—)"
-        print(f"  {medal}    {c['city']:<14}  {c['nhl_team']:<26}  "
-              f"{att_str:>10}  {games_str:>5}  {c['composite_score']:>6.3f}")
+        out.append(f"  {medal}    {c['city']:<14}  {c['nhl_team']:<26}  "
+                   f"{att_str:>10}  {games_str:>5}  {c['composite_score']:>6.3f}")
 
     # ── Detailed breakdown ─────────────────────────────────────────────────────
-    print(f"\n{'─' * 72}")
-    print(f"  DETAILED BREAKDOWN")
-    print(f"{'─' * 72}")
+    out.append(f"\n{'─' * 72}")
+    out.append("  DETAILED BREAKDOWN")
+    out.append(f"{'─' * 72}")
 
     for c in cities:
         medal = MEDAL.get(c["rank"], f"#{c['rank']}")
-        print(f"\n  {medal}  {c['city'].upper()}, {c['state_province']}  "
-              f"—  Composite Score: {c['composite_score']:.3f}/10")
-        print(f"      NHL partner: {c['nhl_team']}")
+        out.append(f"\n  {medal}  {c['city'].upper()}, {c['state_province']}  "
+                   f"—  Composite Score: {c['composite_score']:.3f}/10")
+        out.append(f"      NHL partner: {c['nhl_team']}")
         if c["tour_avg_att"]:
             att_note = (f"avg {c['tour_avg_att']:,}"
                         + (f" across {c['tour_game_count']} games"
                            if c["tour_game_count"] > 1
                            else f" (1 game — {c['tour_total_att']:,} total)"))
-            print(f"      Tour attendance: {att_note}")
+            out.append(f"      Tour attendance: {att_note}")
         else:
-            print(f"      Tour attendance: No Takeover Tour game on record")
-        print()
-        print(_score_block(c["pillar_scores"]))
+            out.append("      Tour attendance: No Takeover Tour game on record")
+        out.append("")
+        out.append(_score_block(c["pillar_scores"]))
 
         if args.verbose:
-            print(f"\n      Notes:")
-            print(f"        NHL:    {c['nhl_market_notes']}")
-            print(f"        Women's: {c['womens_sports_notes']}")
-            print(f"        Arena:  {c['arena_fit_notes']}")
-            print(f"        Geo:    {c['geo_balance_notes']}")
+            out.append("\n      Notes:")
+            out.append(f"        NHL:    {c['nhl_market_notes']}")
+            out.append(f"        Women's: {c['womens_sports_notes']}")
+            out.append(f"        Arena:  {c['arena_fit_notes']}")
+            out.append(f"        Geo:    {c['geo_balance_notes']}")
 
-        print(f"\n      TIKTOK HOOK: \"{c['narrative_hook']}\"")
+        out.append(f"\n      TIKTOK HOOK: \"{c['narrative_hook']}\"")
 
     # ── TikTok script outline ──────────────────────────────────────────────────
     winner = cities[0]
@@ -96,10 +100,10 @@ def main():
     surprise = next((c for c in cities if c["city"] not in
                      ["Chicago", "Detroit"]), cities[2])  # find the "surprise" pick
 
-    print(f"\n{'=' * 72}")
-    print(f"  TIKTOK SCRIPT OUTLINE")
-    print(f"{'=' * 72}")
-    print(f"""
+    out.append(f"\n{'=' * 72}")
+    out.append("  TIKTOK SCRIPT OUTLINE")
+    out.append(f"{'=' * 72}")
+    out.append(f"""
   HOOK:
   "I ran the numbers on where the PWHL should expand next —
    and the answer might actually surprise you."
@@ -127,7 +131,8 @@ def main():
    the numbers to back it up. Which city do YOU think gets the next team? 👇"
 """)
 
-    print(f"{'=' * 72}\n")
+    out.append(f"{'=' * 72}\n")
+    print("\n".join(out))
 
 
 if __name__ == "__main__":
@@ -40,11 +40,10 @@ TEAM_LOGOS = {
 
 
 def _pwhl_logo_uri():
-    for ext in ("png", "svg", "jpg", "webp"):
-        p = ASSETS_DIR / "logos" / f"PWHL_logo.{ext}"
-        if p.exists():
-            return p.resolve().as_uri()
-    return None
+    # Single cached scandir pass instead of one exists() stat per extension.
+    from pwhl_btn.assets import _asset_lookup
+    p = _asset_lookup(str(ASSETS_DIR / "logos"), "PWHL_logo")
+    return p.resolve().as_uri() if p else None
 
 
 TEAM_FULL_NAMES = {
@@ -373,26 +372,32 @@ def get_db_data() -> dict:
 
 
 # ── Renderer ─────────────────────────────────────────────────────────────────
-def render_slide(template_name: str, data: dict, output_path: Path) -> Path:
-    env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
+def _render_one(browser, env, template_name: str, data: dict, output_path: Path) -> Path:
     tmpl = env.get_template(template_name)
     html = tmpl.render(**data)
 
     html_path = OUTPUT_DIR / f"_render_{template_name}"
     html_path.write_text(html, encoding="utf-8")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page(viewport={"width": 1080, "height": 1920})
-        page.goto(f"file://{html_path.resolve()}")
-        page.wait_for_timeout(800)
-        page.screenshot(path=str(output_path), full_page=False)
-        browser.close()
+    page = browser.new_page(viewport={"width": 1080, "height": 1920})
+    page.goto(f"file://{html_path.resolve()}")
+    page.wait_for_timeout(800)
+    page.screenshot(path=str(output_path), full_page=False)
+    page.close()
 
     print(f"  ✅ {output_path.name}")
     return output_path
 
 
+def render_slide(template_name: str, data: dict, output_path: Path) -> Path:
+    env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        path = _render_one(browser, env, template_name, data, output_path)
+        browser.close()
+    return path
+
+
 def render_all(data: dict, out_dir: Path) -> list[Path]:
     slides = [
         ("recap_slide0.html", "recap_0_hook.png"),
@@ -404,10 +409,16 @@ def render_all(data: dict, out_dir: Path) -> list[Path]:
     outputs = []
     print(f"\n🎬 Rendering Weekly Recap — {data['week_range']}")
 
-    for tmpl, fname in slides:
-        path = out_dir / fname.replace(".png", f"_{timestamp}.png")
-        render_slide(tmpl, data, path)
-        outputs.append(path)
+    # One browser launch for the whole batch — starting Chromium dominates
+    # per-slide cost, so the four slides share a browser and template env
+    # (same pattern as power_rankings.render_slides).
+    env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        for tmpl, fname in slides:
+            path = out_dir / fname.replace(".png", f"_{timestamp}.png")
+            outputs.append(_render_one(browser, env, tmpl, data, path))
+        browser.close()
 
     print(f"\n✨ Done — {len(outputs)} slides saved to {out_dir}")
     return outputs
@@ -13,26 +13,39 @@ Run:
 """
 
 import argparse
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
 
+try:
+    import orjson   # optional — C parser, noticeably faster on big payloads
+except ImportError:
+    orjson = None
+
+from pwhl_btn.api_config import API_BASE, API_KEY, CLIENT_CODE
 from pwhl_btn.db.db_config import get_engine
 from pwhl_btn.jobs.backfill import SEASON_ID
 
-API_BASE    = "https://lscluster.hockeytech.com/feed/index.php"
-API_KEY     = "446521baf8c38984"
-CLIENT_CODE = "pwhl"
-
-engine  = get_engine()
+engine  = get_engine(pool_pre_ping=True, pool_recycle=280)
 Session = sessionmaker(bind=engine)
 
+# Pooled session — keep-alive reuses one TLS connection across the
+# per-team calls (the pool is sized for the fetch_all_goalies threads).
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8))
+
 
 def api_get(params: dict) -> dict:
     params.update({"key": API_KEY, "client_code": CLIENT_CODE, "fmt": "json"})
-    r = requests.get(API_BASE, params=params, timeout=15)
+    r = HTTP_SESSION.get(API_BASE, params=params, timeout=15)
     r.raise_for_status()
-    return r.json()
+    if orjson is not None:
+        return orjson.loads(r.content)
+    return json.loads(r.content)
 
 
 def migrate(session):
@@ -92,21 +105,22 @@ def fetch_team_players(team_id: int, player_type: str) -> list[dict]:
 
 
 def fetch_all_goalies(team_ids: list) -> list[dict]:
-    """Fetch goalie stats for all teams via modulekit/statviewtype."""
-    goalies = []
-    for tid in team_ids:
+    """
+    Fetch goalie stats for all teams via modulekit/statviewtype.
+    The per-team requests are independent, so they run on a thread pool —
+    wall time drops from sum-of-round-trips to roughly the slowest one.
+    """
+    def _one(tid: int) -> list[dict]:
         try:
-            data = api_get({
-                "feed":      "modulekit",
-                "view":      "statviewtype",
-                "type":      "goalies",
-                "season_id": SEASON_ID,
-                "league_id": 1,
-                "team_id":   tid,
-            })
-            goalies += data.get("SiteKit", {}).get("Statviewtype", [])
+            return fetch_team_players(tid, "goalies")
         except Exception as e:
             print(f"  [fetch_all_goalies] team {tid} error: {e}")
+            return []
+
+    goalies = []
+    with ThreadPoolExecutor(max_workers=min(8, len(team_ids) or 1)) as pool:
+        for batch in pool.map(_one, team_ids):
+            goalies += batch
     return goalies
 
 
@@ -14,7 +14,6 @@ from __future__ import annotations
 
 import argparse
 import json
-from collections import defaultdict
 from pathlib import Path
 
 from sqlalchemy import text
@@ -63,9 +62,18 @@ def main() -> None:
         placeholders = ", ".join(f":s{i}" for i in range(len(seasons)))
         params = {f"s{i}": s for i, s in enumerate(seasons)}
 
+        # Only filter home venues when the config lists any — an empty list
+        # would otherwise render as "NOT IN ()", which is a syntax error.
+        venue_filter = ""
+        if home_venues:
+            venue_ph = ", ".join(f":v{i}" for i in range(len(home_venues)))
+            params.update({f"v{i}": v for i, v in enumerate(home_venues)})
+            venue_filter = f"AND g.venue NOT IN ({venue_ph})"
+
+        # Aggregate across seasons per venue in SQL — one GROUP BY pass
+        # instead of a per-season query plus a Python re-aggregation loop.
         rows = conn.execute(text(f"""
             SELECT g.venue,
-                   g.season_id,
                    COUNT(*)          AS game_count,
                    SUM(g.attendance) AS total_att
             FROM games g
@@ -73,25 +81,18 @@ def main() -> None:
               AND g.game_status = 'final'
               AND g.venue       IS NOT NULL
               AND g.attendance  IS NOT NULL
-            GROUP BY g.venue, g.season_id
+              {venue_filter}
+            GROUP BY g.venue
         """), params).fetchall()
 
-    # Aggregate across seasons per venue
-    by_venue: dict[str, dict] = defaultdict(lambda: {"total_att": 0, "game_count": 0})
-    for r in rows:
-        if r.venue in home_venues:
-            continue
-        by_venue[r.venue]["total_att"]  += int(r.total_att or 0)
-        by_venue[r.venue]["game_count"] += int(r.game_count)
-
     data = [
         {
-            "venue":      venue,
-            "total_att":  v["total_att"],
-            "game_count": v["game_count"],
-            "avg_att":    round(v["total_att"] / v["game_count"]) if v["game_count"] else 0,
+            "venue":      r.venue,
+            "total_att":  int(r.total_att or 0),
+            "game_count": int(r.game_count),
+            "avg_att":    round(int(r.total_att or 0) / int(r.game_count)) if r.game_count else 0,
         }
-        for venue, v in by_venue.items()
+        for r in rows
     ]
 
     sort_key = {"avg": "avg_att", "total": "total_att", "games": "game_count"}[args.sort]
@@ -15,18 +15,76 @@ NOTE: The NHL public API does not expose per-team attendance figures.
 """
 
 from __future__ import annotations
+import json
+import os
+from pathlib import Path
+
 import requests
+from requests.adapters import HTTPAdapter
 from time import sleep
 
 NHL_RECORDS_BASE = "https://records.nhl.com/site/api"
 NHL_WEB_BASE     = "https://api-web.nhle.com/v1"
 RATE_LIMIT       = 0.3   # seconds between requests
 
+# Conditional-GET cache. Franchise season results are historical data that
+# only change once a year, so we remember each URL's ETag/Last-Modified and
+# let the server answer 304 (no body, no JSON parse) when nothing changed.
+CACHE_FILE = Path(__file__).resolve().parents[3] / "data" / "nhl" / ".http_cache.json"
+_cache: dict | None = None
+
+
+def _load_cache() -> dict:
+    global _cache
+    if _cache is None:
+        try:
+            _cache = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+
+def _save_cache(cache: dict) -> None:
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_FILE.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        pass   # cache is best-effort; never fail the fetch over it
+
+# Shared session so repeated calls reuse one TLS connection per host
+# instead of paying the TCP+TLS handshake on every request.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=8))
+
 
 def _get(url: str, params: dict | None = None) -> dict:
-    resp = requests.get(url, params=params, timeout=15)
+    cache = _load_cache()
+    key   = url + "?" + json.dumps(params or {}, sort_keys=True)
+    entry = cache.get(key)
+
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = SESSION.get(url, params=params, headers=headers, timeout=15)
+    if resp.status_code == 304 and entry:
+        return entry["payload"]
     resp.raise_for_status()
-    return resp.json()
+
+    payload = resp.json()
+    if resp.headers.get("ETag") or resp.headers.get("Last-Modified"):
+        cache[key] = {
+            "etag":          resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "payload":       payload,
+        }
+        _save_cache(cache)
+    return payload
 
 
 def fetch_franchise_seasons(team_id: int, num_seasons: int = 5) -> list[dict]:
@@ -40,13 +40,17 @@ SEASONS_FOR_PLAYOFFS = 5
 
 
 def _compute_raw(team_id: int) -> dict:
-    reg_seasons     = fetch_franchise_seasons(team_id, num_seasons=SEASONS_FOR_SCORE)
+    # One fetch covers both windows: the playoff-rate denominator needs the
+    # last 5 regular seasons and the scoring window is the most recent 3 of
+    # those (the API returns seasons newest-first).
+    reg_seasons     = fetch_franchise_seasons(team_id, num_seasons=SEASONS_FOR_PLAYOFFS)
     playoff_seasons = fetch_franchise_playoff_seasons(team_id, num_seasons=SEASONS_FOR_PLAYOFFS)
+    score_seasons   = reg_seasons[:SEASONS_FOR_SCORE]
 
     # Points percentage over last N regular seasons
     pts_pcts = []
     home_win_pcts = []
-    for s in reg_seasons[:SEASONS_FOR_SCORE]:
+    for s in score_seasons:
         gp  = s.get("gamesPlayed") or 0
         pts = s.get("points")      or 0
         if gp:
@@ -62,7 +66,7 @@ def _compute_raw(team_id: int) -> dict:
 
     # Playoff rate: appearances in last N seasons
     playoff_season_ids = {s.get("seasonId") for s in playoff_seasons}
-    reg_season_ids     = {s.get("seasonId") for s in fetch_franchise_seasons(team_id, num_seasons=SEASONS_FOR_PLAYOFFS)}
+    reg_season_ids     = {s.get("seasonId") for s in reg_seasons}
     playoff_rate       = (len(playoff_season_ids & reg_season_ids) / SEASONS_FOR_PLAYOFFS
                           if reg_season_ids else 0.0)
 
@@ -70,7 +74,7 @@ def _compute_raw(team_id: int) -> dict:
         "avg_pts_pct":   round(avg_pts_pct,  4),
         "avg_home_win":  round(avg_home_win, 4),
         "playoff_rate":  round(playoff_rate, 4),
-        "seasons_used":  len(reg_seasons),
+        "seasons_used":  len(score_seasons),
     }
 
 
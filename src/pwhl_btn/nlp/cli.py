@@ -38,7 +38,10 @@ def main() -> None:
 
         print()
         try:
-            result = run_query(question)
+            # The summary streams to stdout as it generates, so the answer
+            # starts appearing at first token rather than after the full
+            # completion.
+            result = run_query(question, stream_summary=True)
         except EnvironmentError as exc:
             print(f"Configuration error: {exc}\n")
             continue
@@ -46,8 +49,6 @@ def main() -> None:
             print(f"Unexpected error: {exc}\n")
             continue
 
-        # Summary
-        print(result["summary"])
         print()
 
         # Data table
@@ -25,14 +25,21 @@ from __future__ import annotations
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import anthropic
 from sqlalchemy import text
 
+try:
+    import orjson   # optional — C serializer, much faster on big result sets
+except ImportError:
+    orjson = None
+
 from pwhl_btn.db.db_queries import engine
 
 OUTPUT_DIR = Path(__file__).resolve().parents[1] / "output" / "nlp_results"
+OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 MODEL      = "claude-sonnet-4-6"
 
 # ── System prompt ─────────────────────────────────────────────────────────────
@@ -82,11 +89,14 @@ players
 
 # ── Public API ─────────────────────────────────────────────────────────────────
 
-def run_query(question: str) -> dict:
+def run_query(question: str, stream_summary: bool = False) -> dict:
     """
     Translate a natural-language question into SQL, execute it, and return
     a plain-English summary along with the raw data.
 
+    With stream_summary=True the summary is printed to stdout token by token
+    as the model generates it (the returned dict still carries the full text).
+
     Always returns a dict with keys: question, sql, columns, rows, summary.
     On unrecoverable failure, rows will be empty and summary will contain the
     error explanation.
@@ -100,6 +110,7 @@ def run_query(question: str) -> dict:
     rows, columns, err = _execute(sql)
     if err:
         print(f"  [SQL error] {err}\n  Retrying with error context…")
+        _SQL_CACHE.pop(question, None)   # don't replay a known-bad query
         sql = _generate_sql(client, question, prior_sql=sql, error=err)
         rows, columns, err = _execute(sql)
         if err:
@@ -113,11 +124,15 @@ def run_query(question: str) -> dict:
                     f"Error: {err}"
                 ),
             }
+            if stream_summary:
+                # Nothing streamed on this path — surface the failure text.
+                print(result["summary"])
             _save(result)
             return result
 
     # Step 3 — summarise
-    summary = _summarise(client, question, sql, rows, columns)
+    summary = _summarise(client, question, sql, rows, columns,
+                         stream=stream_summary)
 
     result = {
         "question": question,
@@ -132,6 +147,7 @@ def run_query(question: str) -> dict:
 
 # ── Internal helpers ───────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
 def _get_client() -> anthropic.Anthropic:
     key = os.environ.get("ANTHROPIC_API_KEY")
     if not key:
@@ -157,19 +173,32 @@ def _sql_user_message(
     return f"Question: {question}"
 
 
+# Generated SQL per question — a CLI session that re-asks the same question
+# (or a batch that repeats one) skips the Claude round-trip entirely.
+# Retry prompts carry a one-off error string, so they are never cached.
+_SQL_CACHE: dict[str, str] = {}
+
+
 def _generate_sql(
     client: anthropic.Anthropic,
     question: str,
     prior_sql: str | None = None,
     error: str | None = None,
 ) -> str:
+    cacheable = prior_sql is None and error is None
+    if cacheable and question in _SQL_CACHE:
+        return _SQL_CACHE[question]
+
     response = client.messages.create(
         model=MODEL,
         max_tokens=1024,
         system=_SYSTEM,
         messages=[{"role": "user", "content": _sql_user_message(question, prior_sql, error)}],
     )
-    return response.content[0].text.strip()
+    sql = response.content[0].text.strip()
+    if cacheable:
+        _SQL_CACHE[question] = sql
+    return sql
 
 
 def _execute(sql: str) -> tuple[list[dict], list[str], str | None]:
@@ -203,9 +232,20 @@ def _summarise(
     sql: str,
     rows: list[dict],
     columns: list[str],
+    stream: bool = False,
 ) -> str:
     rows_preview = rows[:50]
-    rows_text    = json.dumps(rows_preview, default=str, indent=2) if rows_preview else "(no rows returned)"
+    # Columns once + compact value lists, instead of pretty-printed dicts
+    # that repeat every key on every row — same information at a fraction
+    # of the input tokens per question.
+    rows_text = (
+        json.dumps(
+            {"columns": columns,
+             "rows": [[r.get(c) for c in columns] for r in rows_preview]},
+            default=str, separators=(",", ":"),
+        )
+        if rows_preview else "(no rows returned)"
+    )
     truncated    = f"\n(showing first 50 of {len(rows)} rows)" if len(rows) > 50 else ""
 
     content = (
@@ -216,6 +256,22 @@ def _summarise(
         "the results above. State any assumptions you made. If the results are "
         "empty, explain what that likely means in context."
     )
+    if stream:
+        # Print tokens as they arrive — the first words of the answer show
+        # up at time-to-first-token instead of after the full completion,
+        # which is most of the perceived wait on long summaries.
+        chunks: list[str] = []
+        with client.messages.stream(
+            model=MODEL,
+            max_tokens=1024,
+            messages=[{"role": "user", "content": content}],
+        ) as s:
+            for piece in s.text_stream:
+                print(piece, end="", flush=True)
+                chunks.append(piece)
+        print()
+        return "".join(chunks).strip()
+
     response = client.messages.create(
         model=MODEL,
         max_tokens=1024,
@@ -225,7 +281,9 @@ def _summarise(
 
 
 def _save(result: dict) -> None:
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     ts   = datetime.now().strftime("%Y%m%d_%H%M%S")
     path = OUTPUT_DIR / f"nlp_{ts}.json"
-    path.write_text(json.dumps(result, default=str, indent=2), encoding="utf-8")
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(result, default=str, indent=2), encoding="utf-8")
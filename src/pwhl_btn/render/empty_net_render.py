@@ -40,11 +40,10 @@ _ASSETS_DIR = Path(__file__).resolve().parents[3] / "assets" / "logos"
 # ── Logo helpers ───────────────────────────────────────────────────────────────
 
 def _pwhl_logo_uri() -> str | None:
-    for ext in ("png", "svg", "jpg", "webp"):
-        p = _ASSETS_DIR / f"PWHL_logo.{ext}"
-        if p.exists():
-            return p.resolve().as_uri()
-    return None
+    # Single cached scandir pass instead of one exists() stat per extension.
+    from pwhl_btn.assets import _asset_lookup
+    p = _asset_lookup(str(_ASSETS_DIR), "PWHL_logo")
+    return p.resolve().as_uri() if p else None
 
 
 def _team_logo_uri(abbr: str) -> str | None:
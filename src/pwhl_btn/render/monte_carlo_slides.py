@@ -64,21 +64,24 @@ def _compute_race_fields(teams: list, remaining_games: list) -> dict:
         gp = t.get("gp") or max(1, TOTAL_SEASON_GAMES - t["games_remaining"])
         t["ppg"] = round(t["current_pts"] / gp, 2)
 
-    # Schedule strength — avg playoff_pct of remaining opponents
+    # Schedule strength — avg playoff_pct of remaining opponents.
+    # One pass over the schedule credits both sides of each game, instead
+    # of re-scanning the full remaining slate once per team.
     code_to_team = {t["team_code"]: t for t in teams}
+    opp_pct_sum   = {tc: 0.0 for tc in code_to_team}
+    opp_pct_count = {tc: 0   for tc in code_to_team}
+    for g in remaining_games:
+        hc, ac = g.get("home_code"), g.get("away_code")
+        home, away = code_to_team.get(hc), code_to_team.get(ac)
+        if home and away:
+            opp_pct_sum[hc]   += away["playoff_pct"]
+            opp_pct_count[hc] += 1
+            opp_pct_sum[ac]   += home["playoff_pct"]
+            opp_pct_count[ac] += 1
     for t in teams:
-        opp_pcts = []
-        for g in remaining_games:
-            hc, ac = g.get("home_code"), g.get("away_code")
-            if hc == t["team_code"]:
-                opp = code_to_team.get(ac)
-            elif ac == t["team_code"]:
-                opp = code_to_team.get(hc)
-            else:
-                continue
-            if opp:
-                opp_pcts.append(opp["playoff_pct"])
-        t["sched_strength"] = round(sum(opp_pcts) / len(opp_pcts), 1) if opp_pcts else 50.0
+        tc = t["team_code"]
+        n  = opp_pct_count[tc]
+        t["sched_strength"] = round(opp_pct_sum[tc] / n, 1) if n else 50.0
 
     sorted_by_playoff = sorted(teams, key=lambda x: x["playoff_pct"], reverse=True)
     for i, t in enumerate(sorted_by_playoff):
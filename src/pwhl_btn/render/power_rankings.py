@@ -8,6 +8,7 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import os
 import urllib.request
@@ -15,7 +16,6 @@ from datetime import datetime, date
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader
-from playwright.sync_api import sync_playwright
 
 BASE_DIR     = Path(__file__).parent
 TEMPLATE_DIR = BASE_DIR / "templates"
@@ -44,15 +44,60 @@ def _week_label() -> str:
     return today.strftime("%B %d, %Y").upper()
 
 
-def _generate_blurbs(rankings: list[dict]) -> list[dict]:
+# On-disk cache for Claude responses, keyed by prompt hash. The prompts
+# embed the live stats, so fresh data always misses; re-running the same
+# week after a template tweak hits and costs nothing. AI_CACHE=0 disables.
+_AI_CACHE_DIR = OUTPUT_DIR / ".ai_cache"
+
+
+def _call_claude(prompt: str, max_tokens: int, api_key: str) -> str:
+    cache_on = os.environ.get("AI_CACHE", "1") != "0"
+    cache_path = None
+    if cache_on:
+        h = hashlib.sha256(prompt.encode()).hexdigest()
+        cache_path = _AI_CACHE_DIR / f"{h}.txt"
+        if cache_path.exists():
+            return cache_path.read_text(encoding="utf-8")
+
+    body = json.dumps({
+        "model": "claude-sonnet-4-20250514",
+        "max_tokens": max_tokens,
+        "messages": [{"role": "user", "content": prompt}]
+    }).encode()
+    req = urllib.request.Request(
+        "https://api.anthropic.com/v1/messages",
+        data=body,
+        headers={
+            "Content-Type": "application/json",
+            "x-api-key": api_key,
+            "anthropic-version": "2023-06-01",
+        }
+    )
+    with urllib.request.urlopen(req, timeout=20) as resp:
+        data = json.loads(resp.read())
+    text = data["content"][0]["text"].strip()
+
+    if cache_path is not None:
+        try:
+            _AI_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(text, encoding="utf-8")
+        except OSError:
+            pass   # cache is best-effort
+    return text
+
+
+def _generate_blurbs(rankings: list[dict], hot_player: dict | None = None) -> list[dict]:
     """
-    Call Claude to generate a short opinionated blurb for each team.
-    Falls back to a data-driven default if API call fails.
+    Call Claude to generate a short opinionated blurb for each team — plus the
+    hot-player sentence when one is passed — in a single batched request.
+    Falls back to data-driven defaults if the API call fails.
     """
     api_key = os.environ.get("ANTHROPIC_API_KEY", "")
     if not api_key:
         for team in rankings:
             team["blurb"] = _default_blurb(team)
+        if hot_player:
+            hot_player["blurb"] = _default_hot_player_blurb(hot_player)
         return rankings
 
     teams_summary = "\n".join(
@@ -61,85 +106,48 @@ def _generate_blurbs(rankings: list[dict]) -> list[dict]:
         for t in rankings
     )
 
+    n = len(rankings)
+    hot_section = ""
+    if hot_player:
+        hot_section = (
+            f"\n\nAlso write ONE punchy sentence (max 20 words) about why "
+            f"{hot_player['player_name']} is the hottest player right now: "
+            f"{hot_player['last5_pts']} pts in last 5 games "
+            f"({hot_player['last5_goals']}G, {hot_player['last5_assists']}A), "
+            f"#{hot_player.get('pts_rank', '')} in league scoring with "
+            f"{hot_player['season_pts']} season points. "
+            f"Append it as the final string of the array."
+        )
+
     prompt = f"""You are the analyst behind BTN (By The Numbers), a PWHL analytics account.
 Write a SHORT, punchy, opinionated one-liner for each team's power ranking position.
 Be bold — fans should agree or disagree strongly. Max 7 words per blurb.
 Focus on current streak and recent form above all else.
-Return ONLY a JSON array of 8 strings in ranking order (no keys, no markdown).
+Return ONLY a JSON array of {n + 1 if hot_player else n} strings in ranking order (no keys, no markdown).
 
 Current rankings:
-{teams_summary}"""
+{teams_summary}{hot_section}"""
 
     try:
-        body = json.dumps({
-            "model": "claude-sonnet-4-20250514",
-            "max_tokens": 400,
-            "messages": [{"role": "user", "content": prompt}]
-        }).encode()
-        req = urllib.request.Request(
-            "https://api.anthropic.com/v1/messages",
-            data=body,
-            headers={
-                "Content-Type": "application/json",
-                "x-api-key": api_key,
-                "anthropic-version": "2023-06-01",
-            }
-        )
-        with urllib.request.urlopen(req, timeout=20) as resp:
-            data = json.loads(resp.read())
-        text = data["content"][0]["text"].strip()
+        text = _call_claude(prompt, max_tokens=500, api_key=api_key)
         # Strip markdown fences if present
         text = text.replace("```json", "").replace("```", "").strip()
         blurbs = json.loads(text)
         for i, team in enumerate(rankings):
             team["blurb"] = blurbs[i] if i < len(blurbs) else _default_blurb(team)
+        if hot_player:
+            hot_player["blurb"] = (blurbs[n].strip('"') if len(blurbs) > n
+                                   else _default_hot_player_blurb(hot_player))
     except Exception as e:
         print(f"  [Blurbs] Claude API error: {e} — using defaults")
         for team in rankings:
             team["blurb"] = _default_blurb(team)
+        if hot_player:
+            hot_player["blurb"] = _default_hot_player_blurb(hot_player)
 
     return rankings
 
 
-def _generate_hot_player_blurb(player: dict) -> str:
-    """Generate an opinionated sentence about the hot player."""
-    api_key = os.environ.get("ANTHROPIC_API_KEY", "")
-    if not api_key:
-        return _default_hot_player_blurb(player)
-
-    prompt = (
-        f"You write for BTN (By The Numbers), a bold PWHL analytics account. "
-        f"Write ONE punchy sentence (max 20 words) about why {player['player_name']} "
-        f"is the hottest player right now. "
-        f"Stats: {player['last5_pts']} pts in last 5 games "
-        f"({player['last5_goals']}G, {player['last5_assists']}A), "
-        f"#{'1' if player.get('pts_rank') == 1 else str(player.get('pts_rank',''))} in league scoring "
-        f"with {player['season_pts']} season points. "
-        f"Be opinionated and specific. Return ONLY the sentence, no quotes."
-    )
-    try:
-        body = json.dumps({
-            "model": "claude-sonnet-4-20250514",
-            "max_tokens": 80,
-            "messages": [{"role": "user", "content": prompt}]
-        }).encode()
-        req = urllib.request.Request(
-            "https://api.anthropic.com/v1/messages",
-            data=body,
-            headers={
-                "Content-Type": "application/json",
-                "x-api-key": api_key,
-                "anthropic-version": "2023-06-01",
-            }
-        )
-        with urllib.request.urlopen(req, timeout=20) as resp:
-            data = json.loads(resp.read())
-        return data["content"][0]["text"].strip().strip('"')
-    except Exception as e:
-        print(f"  [Blurb] {e}")
-        return _default_hot_player_blurb(player)
-
-
 def _default_hot_player_blurb(player: dict) -> str:
     g, a = player["last5_goals"], player["last5_assists"]
     if g >= 4:
@@ -258,18 +266,28 @@ def get_sample_data() -> dict:
     }
 
 
-def get_live_data() -> dict:
+def get_live_data(skip_ai: bool = False) -> dict:
     from pwhl_btn.db.db_queries import get_power_rankings, get_hot_player, get_offense_defense_breakdown, _pwhl_logo_uri
 
-    rankings = get_power_rankings()
-    rankings = _generate_blurbs(rankings)
+    rankings   = get_power_rankings()
+    hot_player = get_hot_player()
+
+    if skip_ai:
+        # Dry runs use the data-driven fallbacks — no paid API calls.
+        for team in rankings:
+            team["blurb"] = _default_blurb(team)
+        if hot_player:
+            hot_player["blurb"] = _default_hot_player_blurb(hot_player)
+    else:
+        # One batched Claude call covers the eight team blurbs and the
+        # hot-player sentence — half the requests, half the prompt-overhead
+        # tokens, and the output is not latency-sensitive here anyway.
+        rankings = _generate_blurbs(rankings, hot_player)
 
     hot  = max(rankings, key=lambda x: x["streak"])
     cold = min(rankings, key=lambda x: x["streak"])
 
-    hot_player = get_hot_player()
     if hot_player:
-        hot_player["blurb"] = _generate_hot_player_blurb(hot_player)
         hot_player["pwhl_logo"] = _pwhl_logo_uri()
 
     breakdown = get_offense_defense_breakdown()
@@ -399,6 +417,10 @@ def _build_scatter_svg(breakdown: dict) -> str:
 
 
 def render_slides(data: dict) -> list:
+    # Imported here, not at module top — --dry-run runs and callers that only
+    # want _call_claude skip the playwright startup cost entirely.
+    from playwright.sync_api import sync_playwright
+
     env       = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
     timestamp = datetime.now().strftime("%Y%m%d_%H%M")
     outputs   = []
@@ -441,9 +463,21 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--sample",     action="store_true")
     parser.add_argument("--skip-drive", action="store_true")
+    parser.add_argument("--dry-run",    action="store_true",
+                        help="Print the rankings data and exit — no AI calls, rendering, or upload")
     args = parser.parse_args()
 
     print("\n── Power Rankings ──────────────────────────────")
+    if args.dry_run:
+        data = get_sample_data() if args.sample else get_live_data(skip_ai=True)
+        for t in data["rankings"]:
+            print(f"  #{t['rank']} {t['team_code']:<4} {t['streak_label']:<4} "
+                  f"pts={t['pts']:<3} ppg={t['ppg']:.2f}  {t['blurb']}")
+        if data.get("hot_player"):
+            hp = data["hot_player"]
+            print(f"  🔥 {hp['player_name']} ({hp['team_code']}) — {hp['blurb']}")
+        return
+
     data    = get_sample_data() if args.sample else get_live_data()
     outputs = render_slides(data)
 
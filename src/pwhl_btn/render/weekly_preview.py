@@ -12,6 +12,7 @@ import argparse
 import json
 import os
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, date
 from pathlib import Path
 
@@ -66,6 +67,10 @@ def _current_week_num(start_date):
 
 
 def generate_why_watch(home_team, away_team, home_record, away_record, key_players) -> str:
+    # Shares power_rankings' prompt-hash disk cache — re-rendering the same
+    # week's preview (records and key players unchanged) costs nothing.
+    from pwhl_btn.render.power_rankings import _call_claude
+
     try:
         players_str = ", ".join(p["name"] for p in key_players[:3])
         prompt = (
@@ -75,24 +80,8 @@ def generate_why_watch(home_team, away_team, home_record, away_record, key_playe
             f"Focus on standings stakes, rivalry, or player storylines. "
             f"No emojis. No quotes. Conversational tone."
         )
-        payload = json.dumps({
-            "model": "claude-sonnet-4-20250514",
-            "max_tokens": 120,
-            "messages": [{"role": "user", "content": prompt}]
-        }).encode()
-        req = urllib.request.Request(
-            "https://api.anthropic.com/v1/messages",
-            data=payload,
-            headers={
-                "Content-Type": "application/json",
-                "anthropic-version": "2023-06-01",
-                "x-api-key": os.environ.get("ANTHROPIC_API_KEY", ""),
-            },
-            method="POST"
-        )
-        with urllib.request.urlopen(req) as resp:
-            data = json.loads(resp.read())
-            return data["content"][0]["text"].strip()
+        return _call_claude(prompt, max_tokens=120,
+                            api_key=os.environ.get("ANTHROPIC_API_KEY", ""))
     except Exception as e:
         print(f"  [Why watch] API error: {e}")
         return "Two of the league's most competitive teams clash with real playoff implications on the line."
@@ -104,21 +93,31 @@ def get_live_data() -> dict:
     start, end = _next_week_range()
     print(f"  Week: {start} → {end}")
 
-    schedule  = get_upcoming_schedule(start, end)
-    gtw       = get_game_to_watch(start, end)
-    standings = get_preview_standings()
-
-    games_count     = sum(len(d["games"]) for d in schedule)
-    teams_in_action = len({t for d in schedule for g in d["games"]
-                           for t in [g["away_team"], g["home_team"]]})
-
-    if gtw:
-        print(f"  Generating why-watch for {gtw['gtw_away_team']} @ {gtw['gtw_home_team']}...")
-        gtw["why_watch"] = generate_why_watch(
-            gtw["gtw_home_team"], gtw["gtw_away_team"],
-            gtw["gtw_home_record"], gtw["gtw_away_record"],
-            gtw["key_players"]
-        )
+    schedule = get_upcoming_schedule(start, end)
+    gtw      = get_game_to_watch(start, end)
+
+    # Fire the why-watch Claude call as soon as the game-to-watch is known
+    # and overlap it with the standings query — the seconds-long API
+    # round-trip no longer serializes with the DB work.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        why_future = None
+        if gtw:
+            print(f"  Generating why-watch for {gtw['gtw_away_team']} @ {gtw['gtw_home_team']}...")
+            why_future = pool.submit(
+                generate_why_watch,
+                gtw["gtw_home_team"], gtw["gtw_away_team"],
+                gtw["gtw_home_record"], gtw["gtw_away_record"],
+                gtw["key_players"],
+            )
+
+        standings = get_preview_standings()
+
+        games_count     = sum(len(d["games"]) for d in schedule)
+        teams_in_action = len({t for d in schedule for g in d["games"]
+                               for t in [g["away_team"], g["home_team"]]})
+
+        if why_future is not None:
+            gtw["why_watch"] = why_future.result()
 
     data = {
         "week_label":          f"WEEK {_current_week_num(start)}",
@@ -36,28 +36,32 @@ TEAM_LOGOS = {
 }
 
 def _pwhl_logo_uri():
-    for ext in ("png", "svg", "jpg", "webp"):
-        p = Path(__file__).parent / "assets" / "logos" / f"PWHL_logo.{ext}"
-        if p.exists():
-            return p.resolve().as_uri()
-    return None
+    # Single cached scandir pass instead of one exists() stat per extension.
+    from pwhl_btn.assets import _asset_lookup
+    p = _asset_lookup(str(Path(__file__).parent / "assets" / "logos"), "PWHL_logo")
+    return p.resolve().as_uri() if p else None
 
 
 _PLAYERS_DIR = Path(__file__).resolve().parents[3] / "assets" / "players"
 
 def _player_photo_uri(player_name: str) -> str | None:
     """Look up a player photo in assets/players/ by name.
-    Tries 'firstname_lastname' and 'lastname_firstname' slugs."""
+    Tries 'firstname_lastname' and 'lastname_firstname' slugs.
+
+    Uses the cached scandir index from db_queries instead of probing
+    exists() per slug × extension (up to 8 stat calls per player)."""
+    from pwhl_btn.assets import _photo_index
+
+    index = _photo_index(str(_PLAYERS_DIR))
     parts = player_name.lower().split()
     candidates = [
         "_".join(parts),           # alina_muller
         "_".join(reversed(parts)), # muller_alina (fallback)
     ]
     for slug in candidates:
-        for ext in ("webp", "png", "jpg", "jpeg"):
-            p = _PLAYERS_DIR / f"{slug}.{ext}"
-            if p.exists():
-                return p.resolve().as_uri()
+        p = index.get(slug)
+        if p:
+            return p.resolve().as_uri()
     return None
 
 TEAM_FULL_NAMES = {
@@ -19,35 +19,46 @@ import json
 import time
 import urllib.request
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
 
+try:
+    import orjson   # optional — much faster on the per-game summary payloads
+except ImportError:
+    orjson = None
+
 # ── Paths ─────────────────────────────────────────────────────────────────────
 SCRIPT_DIR = Path(__file__).resolve().parent
 OUTPUT_DIR = SCRIPT_DIR / "output"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 # ── API config ────────────────────────────────────────────────────────────────
-BASE_URL    = "https://lscluster.hockeytech.com/feed/index.php"
-API_KEY     = "446521baf8c38984"
-CLIENT_CODE = "pwhl"
+from pwhl_btn.api_config import API_BASE as BASE_URL, API_KEY, CLIENT_CODE
+
 SEASON_ID   = 8
 
 
 # ── API helpers ───────────────────────────────────────────────────────────────
 
 def api_get(url):
+    # Parse the raw bytes directly — both parsers accept bytes, so there is
+    # no need for an intermediate decoded string copy.
     with urllib.request.urlopen(url, timeout=15) as r:
-        raw = r.read().decode("utf-8").strip()
-        if raw.startswith("(") and raw.endswith(")"):
-            raw = raw[1:-1]
-        return json.loads(raw)
+        raw = r.read().strip()
+        # Unwrap JSONP-style padding (bare parens or an
+        # "angular.callbacks_N(...)" prefix) with one forward and one
+        # reverse partition — two scans over the buffer, no str decode.
+        if raw[:1] not in (b"{", b"["):
+            _, sep, rest = raw.partition(b"(")
+            if sep:
+                raw = rest.rpartition(b")")[0] or raw
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 
 def get_season_game_ids(season_id):
-    from datetime import datetime as _dt
     url = (f"{BASE_URL}?feed=modulekit&view=schedule&season_id={season_id}"
            f"&key={API_KEY}&client_code={CLIENT_CODE}&fmt=json")
     data = api_get(url)
@@ -68,17 +79,27 @@ def get_season_game_ids(season_id):
         game_ids.append(gid)
         raw_date = str(g.get("date_played", "")).strip()
         try:
-            game_dates[gid] = f"{_dt.strptime(raw_date, '%Y-%m-%d').month}/{_dt.strptime(raw_date, '%Y-%m-%d').day}"
+            # The label only needs month/day — a string split beats building
+            # a date object per schedule row.
+            _, m, d = raw_date.split("-", 2)
+            game_dates[gid] = f"{int(m)}/{int(d)}"
         except (ValueError, TypeError):
             game_dates[gid] = ""
     return game_ids, game_dates
 
 
+# The only gameSummary sections the analysis reads. Everything else in the
+# payload (play-by-play, officials, media links, ...) is dropped at fetch
+# time so holding a whole season of prefetched summaries stays cheap.
+_SUMMARY_KEYS = ("homeTeam", "visitingTeam", "periods")
+
+
 def get_game_summary(game_id):
     url = (f"{BASE_URL}?feed=statviewfeed&view=gameSummary&game_id={game_id}"
            f"&key={API_KEY}&client_code={CLIENT_CODE}&lang=en&league_id=1&fmt=json")
     try:
-        return api_get(url)
+        data = api_get(url)
+        return {k: data[k] for k in _SUMMARY_KEYS if k in data}
     except Exception as e:
         print(f"    game {game_id}: error - {e}")
         return None
@@ -109,9 +130,15 @@ def analyze_games(game_ids, game_dates=None):
     pull_scored_events     = []  # per-event detail records for the list slide
 
     total = len(game_ids)
-    for i, gid in enumerate(game_ids, 1):
+
+    # Download every game summary up front on a small thread pool — the
+    # fetches are independent network I/O, so they overlap instead of
+    # paying one round trip per game. The analysis below stays serial.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        summaries = list(pool.map(get_game_summary, game_ids))
+
+    for i, (gid, data) in enumerate(zip(game_ids, summaries), 1):
         print(f"  [{i}/{total}] game {gid}...")
-        data = get_game_summary(gid)
         if not data:
             continue
 
@@ -128,15 +155,16 @@ def analyze_games(game_ids, game_dates=None):
 
         game_date = (game_dates or {}).get(gid, "")
 
-        # Final score — sum goals across all periods per team
-        home_score = sum(
-            1 for p in periods for g in p.get("goals", [])
-            if g.get("team", {}).get("id") == home_id
-        )
-        away_score = sum(
-            1 for p in periods for g in p.get("goals", [])
-            if g.get("team", {}).get("id") == away_id
-        )
+        # Final score — tally both teams in one walk over the goal list
+        # instead of scanning every period's goals twice.
+        home_score = away_score = 0
+        for p in periods:
+            for g in p.get("goals", []):
+                scoring_id = g.get("team", {}).get("id")
+                if scoring_id == home_id:
+                    home_score += 1
+                elif scoring_id == away_id:
+                    away_score += 1
 
         # Build 3rd-period goal timeline: {team_id: [time_in_seconds, ...]}
         # Used to check whether the pulling team scored during a pull window.
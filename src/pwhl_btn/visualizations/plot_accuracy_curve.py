@@ -16,6 +16,7 @@ import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import matplotlib.lines as mlines
+from matplotlib.ticker import StrMethodFormatter
 
 PWHL_BTN_DIR = Path(__file__).resolve().parent.parent
 OUTPUT_DIR   = PWHL_BTN_DIR / "output"
@@ -48,10 +49,10 @@ ax.set_facecolor(BG)
 ax.set_xlim(25, 95)
 ax.set_ylim(0.0, 1.05)
 ax.set_xticks([33, 50, 67, 80, 90])
-ax.set_xticklabels(["33%", "50%", "67%", "80%", "90%"], color=FG, fontsize=13)
+ax.xaxis.set_major_formatter(StrMethodFormatter("{x:.0f}%"))
 ax.set_yticks([0.0, 0.2, 0.4, 0.6, 0.8, 1.0])
-ax.set_yticklabels(["0.0", "0.2", "0.4", "0.6", "0.8", "1.0"], color=FG, fontsize=13)
-ax.tick_params(colors=FG, which="both", length=0)
+ax.yaxis.set_major_formatter(StrMethodFormatter("{x:.1f}"))
+ax.tick_params(colors=FG, which="both", length=0, labelsize=13)
 for spine in ax.spines.values():
     spine.set_edgecolor(GRID)
 ax.yaxis.grid(True, color=GRID, linewidth=0.6, linestyle="--", zorder=0)
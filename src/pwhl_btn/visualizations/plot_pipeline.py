@@ -10,9 +10,8 @@ Run from repo root:
 """
 
 from pathlib import Path
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.patches import FancyBboxPatch
 
 OUTPUT_DIR = Path(__file__).resolve().parent.parent / "output"
@@ -74,7 +73,11 @@ TOP_Y   = FIG_H - HDR
 
 # ── Figure ────────────────────────────────────────────────────────────────────
 
-fig, ax = plt.subplots(figsize=(FIG_W, FIG_H))
+# Non-interactive producer — build the Figure directly on an Agg canvas
+# instead of going through pyplot's global figure manager and backend probe.
+fig = Figure(figsize=(FIG_W, FIG_H))
+FigureCanvasAgg(fig)
+ax = fig.subplots()
 fig.patch.set_facecolor(BG)
 ax.set_facecolor(BG)
 ax.set_xlim(0, FIG_W)
@@ -151,12 +154,11 @@ ax.text(FIG_W - 0.14, 0.06, "ByTheNumbers · PWHL Analytics",
 
 # ── Save ──────────────────────────────────────────────────────────────────────
 
-plt.tight_layout(pad=0)
+fig.tight_layout(pad=0)
 png_path = OUTPUT_DIR / "pipeline.png"
 svg_path = OUTPUT_DIR / "pipeline.svg"
-fig.savefig(png_path, dpi=400, bbox_inches="tight", facecolor=BG)
+fig.savefig(png_path, dpi=200, bbox_inches="tight", facecolor=BG)
 fig.savefig(svg_path, format="svg", bbox_inches="tight", facecolor=BG)
-plt.close()
 
 print(f"  Saved -> {png_path}")
 print(f"  Saved -> {svg_path}")
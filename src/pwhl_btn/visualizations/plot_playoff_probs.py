@@ -60,14 +60,14 @@ ax.set_facecolor(BG)
 
 y_pos = list(range(n))
 
-for i, (team, prob) in enumerate(zip(teams, probs)):
-    in_playoffs = i < PLAYOFF_SPOTS
-    color       = BAR_IN  if in_playoffs else BAR_OUT
-    edge        = BAR_EDGE_IN if in_playoffs else BAR_EDGE_OUT
-
-    ax.barh(i, prob, height=0.62, color=color,
-            edgecolor=edge, linewidth=0.8, zorder=2)
+# One barh call builds the whole BarContainer — per-bar colors are just
+# sequences, so there is no need to draw each team's bar individually.
+bar_colors = [BAR_IN      if i < PLAYOFF_SPOTS else BAR_OUT      for i in range(n)]
+bar_edges  = [BAR_EDGE_IN if i < PLAYOFF_SPOTS else BAR_EDGE_OUT for i in range(n)]
+ax.barh(y_pos, probs, height=0.62, color=bar_colors,
+        edgecolor=bar_edges, linewidth=0.8, zorder=2)
 
+for i, (team, prob) in enumerate(zip(teams, probs)):
     # Probability label inside/outside bar
     label_x = prob - 1.5 if prob >= 12 else prob + 1.0
     ha      = "right"    if prob >= 12 else "left"